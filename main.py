@@ -49,8 +49,7 @@ def main():
     if args.mode == "server":
         server_mode(args.host, args.port)
     elif args.mode == "cli":
-        sys.argv = ["main.py"] + sys.argv[2:]  # Adjust arguments for CLI
-        return cli_main()
+        return cli_main(sys.argv[2:])
     else:
         parser.print_help()
         return 1
@@ -1,14 +1,29 @@
 """
 PDF processing adapters module.
 Provides various implementations for PDF text extraction and obfuscation.
+
+Adapters are imported on first access, so importing one adapter module
+(e.g. local storage) does not load every PDF library.
 """
+import importlib
 
-from .pymupdf_adapter import PyMuPdfAdapter
-from .pypdfium2_adapter import PyPdfium2Adapter
-from .pdfplumber_adapter import PdfPlumberAdapter
+_ADAPTER_MODULES = {
+    "PyMuPdfAdapter": ".pymupdf_adapter",
+    "PyPdfium2Adapter": ".pypdfium2_adapter",
+    "PdfPlumberAdapter": ".pdfplumber_adapter"
+}
 
 __all__ = [
     "PyMuPdfAdapter",
     "PyPdfium2Adapter", 
     "PdfPlumberAdapter"
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _ADAPTER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    adapter_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = adapter_class
+    return adapter_class
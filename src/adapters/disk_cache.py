@@ -0,0 +1,97 @@
+"""
+Disk cache for text extraction results.
+Stores one JSON file per result, keyed by a hash of the document content
+and of the extraction settings, so unchanged documents are not OCR'd again.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from ..domain.entities import TextExtractionResult
+
+
+class DiskCache:
+    """Content-addressed cache of TextExtractionResult objects on the local disk."""
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached results (created if missing)
+        """
+        self._cache_dir = Path(cache_dir)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(content: bytes, *settings: object) -> str:
+        """
+        Build the cache key of a document.
+
+        Args:
+            content: Document content (or a digest of it)
+            *settings: Extraction settings that influence the result
+
+        Returns:
+            str: Hex digest identifying the content and settings
+        """
+        digest = hashlib.sha256(content)
+        for setting in settings:
+            digest.update(b"\0" + repr(setting).encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[TextExtractionResult]:
+        """
+        Load a cached result.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[TextExtractionResult]: Cached result, or None on a miss
+            (unreadable entries count as misses)
+        """
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return TextExtractionResult(
+                text=data["text"],
+                page_count=data["page_count"],
+                word_count=data["word_count"],
+                pages=data["pages"]
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: str, result: TextExtractionResult) -> None:
+        """
+        Store a result.
+        The entry is written to a temporary file then renamed, so concurrent
+        readers never see a partial entry.
+
+        Args:
+            key: Cache key from make_key
+            result: Extraction result to store
+        """
+        data = {
+            "text": result.text,
+            "pages": result.pages,
+            "page_count": result.page_count,
+            "word_count": result.word_count
+        }
+        fd, temp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self._entry_path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of the file holding the entry for a key."""
+        return self._cache_dir / f"{key}.json"
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import BinaryIO, Hashable, Optional
 from src.ports.file_storage_port import FileStoragePort
 from src.domain.exceptions import FileStorageError
 
@@ -46,6 +47,66 @@ class LocalStorageAdapter(FileStoragePort):
         except Exception as e:
             raise FileStorageError(f"Error reading file {file_path}: {str(e)}")
     
+    def open_file(self, file_path: str) -> BinaryIO:
+        """
+        Open a file of the local file system for reading.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            BinaryIO: File object, to be closed by the caller
+            
+        Raises:
+            FileStorageError: In case of read error
+        """
+        try:
+            resolved_path = self._resolve_path(file_path)
+            
+            if not resolved_path.is_file():
+                raise FileStorageError(f"File {resolved_path} does not exist")
+            
+            return open(resolved_path, 'rb')
+                
+        except FileStorageError:
+            raise
+        except Exception as e:
+            raise FileStorageError(f"Error reading file {file_path}: {str(e)}")
+    
+    def read_file_range(self, file_path: str, offset: int, length: int) -> bytes:
+        """
+        Read part of a file from the local file system.
+        
+        Args:
+            file_path: Path to the file
+            offset: Position of the first byte; negative values count from the end of the file
+            length: Maximum number of bytes to read
+            
+        Returns:
+            bytes: Up to length bytes starting at offset
+            
+        Raises:
+            FileStorageError: In case of read error
+        """
+        try:
+            resolved_path = self._resolve_path(file_path)
+            
+            if not resolved_path.is_file():
+                raise FileStorageError(f"File {resolved_path} does not exist")
+            
+            with open(resolved_path, 'rb') as f:
+                if offset < 0:
+                    # Clamp to the start of files shorter than the requested tail
+                    f.seek(max(f.seek(0, os.SEEK_END) + offset, 0))
+                else:
+                    f.seek(offset)
+                return f.read(length)
+                
+        except FileStorageError:
+            raise
+        except Exception as e:
+            raise FileStorageError(f"Error reading file {file_path}: {str(e)}")
+    
     def write_file(self, file_path: str, content: bytes) -> None:
         """
         Write a file to the local file system.
@@ -69,6 +130,26 @@ class LocalStorageAdapter(FileStoragePort):
         except Exception as e:
             raise FileStorageError(f"Error writing file {file_path}: {str(e)}")
     
+    def get_local_path(self, file_path: str) -> Optional[str]:
+        """
+        Get the local path of a file, creating its parent directories.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Optional[str]: Resolved path of the file
+            
+        Raises:
+            FileStorageError: If the parent directories cannot be created
+        """
+        try:
+            resolved_path = self._resolve_path(file_path)
+            resolved_path.parent.mkdir(parents=True, exist_ok=True)
+            return str(resolved_path)
+        except Exception as e:
+            raise FileStorageError(f"Error preparing file {file_path}: {str(e)}")
+    
     def file_exists(self, file_path: str) -> bool:
         """
         Check if a file exists.
@@ -80,11 +161,27 @@ class LocalStorageAdapter(FileStoragePort):
             bool: True if the file exists
         """
         try:
-            resolved_path = self._resolve_path(file_path)
-            return resolved_path.exists() and resolved_path.is_file()
+            # is_file() is False for missing paths, so a single stat is enough
+            return self._resolve_path(file_path).is_file()
         except Exception:
             return False
     
+    def get_file_signature(self, file_path: str) -> Optional[Hashable]:
+        """
+        Get the modification time and size of a file.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Optional[Hashable]: (mtime_ns, size) tuple, or None if the file cannot be inspected
+        """
+        try:
+            stat_result = self._resolve_path(file_path).stat()
+            return (stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            return None
+    
     def delete_file(self, file_path: str) -> None:
         """
         Delete a file.
@@ -2,8 +2,9 @@
 Mistral text extractor adapter.
 Uses Mistral AI OCR for text extraction.
 """
-import re
+import threading
 import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from mistralai import Mistral
@@ -24,6 +25,9 @@ class MistralTextExtractor(TextExtractorPort):
     Uses Mistral AI for text extraction.
     """
     
+    # Number of documents whose quality annotation is kept
+    _ANNOTATION_HISTORY_SIZE = 16
+    
     def __init__(self, file_storage, mistral_api_key: Optional[str] = None):
         """
         Initialize the extractor.
@@ -41,20 +45,31 @@ class MistralTextExtractor(TextExtractorPort):
         # Initialize Mistral client
         self._mistral_client = Mistral(api_key=self._mistral_api_key)
         self._last_quality_annotation = None
+        # Annotations of the latest documents, so concurrent extractions keep their own
+        self._quality_annotations: "OrderedDict[str, DocumentQualityAnnotation]" = OrderedDict()
+        self._annotations_lock = threading.Lock()
     
     def extract_text(self, document: Document) -> TextExtractionResult:
         """Extract text from PDF using Mistral AI OCR."""
         start_time = time.time()
         try:
             # Read PDF content directly
-            pdf_content = self._file_storage.read_file(document.path)
+            pdf_content = document.data if document.data is not None else self._file_storage.read_file(document.path)
             
             # Extract text directly from PDF using Mistral OCR
-            extracted_text, page_count, pages = self._extract_text_with_mistral(pdf_content)
+            extracted_text, page_count, pages, annotation = self._extract_text_with_mistral(pdf_content)
+            with self._annotations_lock:
+                self._last_quality_annotation = annotation
+                self._quality_annotations[document.path] = annotation
+                self._quality_annotations.move_to_end(document.path)
+                while len(self._quality_annotations) > self._ANNOTATION_HISTORY_SIZE:
+                    self._quality_annotations.popitem(last=False)
             
-            # Clean up text (remove extra whitespace)
-            full_text = re.sub(r'\s+', ' ', extracted_text).strip()
-            word_count = len(full_text.split())
+            # Clean up text (remove extra whitespace): a single split both
+            # collapses whitespace and counts words
+            words = extracted_text.split()
+            full_text = " ".join(words)
+            word_count = len(words)
             
             execution_time = time.time() - start_time
             
@@ -70,7 +85,7 @@ class MistralTextExtractor(TextExtractorPort):
             execution_time = time.time() - start_time
             raise DocumentProcessingError(f"Error extracting text with Mistral OCR: {str(e)}")
     
-    def _extract_text_with_mistral(self, pdf_content: bytes) -> tuple[str, int, list[str]]:
+    def _extract_text_with_mistral(self, pdf_content: bytes) -> tuple[str, int, list[str], DocumentQualityAnnotation]:
         """Extract text from PDF using Mistral AI Document Annotations."""
         try:
             # Encode PDF to base64
@@ -89,7 +104,6 @@ class MistralTextExtractor(TextExtractorPort):
             )
             
             # Extract text from OCR response and quality annotations
-            extracted_text = ""
             pages = []
             page_count = 0
             
@@ -102,37 +116,36 @@ class MistralTextExtractor(TextExtractorPort):
                         # Use strip-markdown to clean markdown formatting
                         clean_page_text = strip_markdown.strip_markdown(page_text)
                         
-                        extracted_text += clean_page_text + " "
                         pages.append(clean_page_text)
                     else:
                         # Fallback if markdown not available
                         page_text = str(page)
-                        extracted_text += page_text + " "
                         pages.append(page_text)
+            extracted_text = " ".join(pages)
             
-            # Store quality annotation for later use
+            # Quality annotation of this document
             if hasattr(response, 'document_annotation') and response.document_annotation:
                 # Document Annotations mode was used
-                self._last_quality_annotation = response.document_annotation
+                annotation = response.document_annotation
                 # Add processing mode information
-                if hasattr(self._last_quality_annotation, 'processing_mode'):
+                if hasattr(annotation, 'processing_mode'):
                     # Only assign if it's a Pydantic model, not a string
-                    if not isinstance(self._last_quality_annotation, str):
-                        self._last_quality_annotation.processing_mode = "document_annotations"
+                    if not isinstance(annotation, str):
+                        annotation.processing_mode = "document_annotations"
                 else:
                     # Create a new annotation with mode info if not present
-                    if isinstance(self._last_quality_annotation, dict):
-                        self._last_quality_annotation['processing_mode'] = "document_annotations"
+                    if isinstance(annotation, dict):
+                        annotation['processing_mode'] = "document_annotations"
                     else:
                         # For Pydantic models, we need to create a new one
-                        if hasattr(self._last_quality_annotation, 'model_dump'):
-                            annotation_dict = self._last_quality_annotation.model_dump()
+                        if hasattr(annotation, 'model_dump'):
+                            annotation_dict = annotation.model_dump()
                             annotation_dict['processing_mode'] = "document_annotations"
-                            self._last_quality_annotation = DocumentQualityAnnotation(**annotation_dict)
+                            annotation = DocumentQualityAnnotation(**annotation_dict)
             else:
                 # Fallback OCR mode was used
                 # Create a minimal annotation with fallback info
-                self._last_quality_annotation = DocumentQualityAnnotation(
+                annotation = DocumentQualityAnnotation(
                     processing_mode="fallback_ocr",
                     quality_metrics=QualityMetrics(
                         total_words=len(extracted_text.split()),
@@ -150,14 +163,17 @@ class MistralTextExtractor(TextExtractorPort):
                     confidence_score=0.5
                 )
             
-            return extracted_text, page_count, pages
+            return extracted_text, page_count, pages, annotation
             
         except Exception as e:
             raise DocumentProcessingError(f"Error extracting text with Mistral OCR: {str(e)}")
     
-    def get_quality_annotation(self) -> Optional[DocumentQualityAnnotation]:
-        """Get the last quality annotation from Document AI processing."""
-        return self._last_quality_annotation
+    def get_quality_annotation(self, document: Optional[Document] = None) -> Optional[DocumentQualityAnnotation]:
+        """Get the quality annotation of a document (default: of the last extraction) from Document AI processing."""
+        with self._annotations_lock:
+            if document is None:
+                return self._last_quality_annotation
+            return self._quality_annotations.get(document.path)
     
     def get_extractor_info(self) -> Dict[str, Any]:
         """Get information about this text extractor."""
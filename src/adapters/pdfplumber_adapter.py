@@ -5,7 +5,9 @@ Robust approach combining precise text extraction with raster-based obfuscation.
 import io
 import tempfile
 import os
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Tuple
 
 try:
     import pdfplumber
@@ -26,9 +28,17 @@ class PdfPlumberAdapter(PdfProcessorPort):
     Combines precise text extraction with robust raster-based obfuscation.
     """
     
+    # Number of documents whose extracted words are kept
+    _WORDS_CACHE_SIZE = 8
+    
     def __init__(self, file_storage: FileStoragePort):
         """Initialize the adapter with a storage system."""
         self.file_storage = file_storage
+        # Words of each page of recent documents: word extraction dominates the search
+        # cost, and the same document is often searched again (validation, new terms).
+        # Entries keep supplied content, to confirm hits on its hash
+        self._words_cache: "OrderedDict[Tuple[str, Hashable], Tuple[Optional[bytes], List[Tuple[List[dict], List[str]]]]]" = OrderedDict()
+        self._words_cache_lock = threading.Lock()
     
     def extract_text_occurrences(self, document: Document, term: Term) -> List[TermOccurrence]:
         """
@@ -42,101 +52,199 @@ class PdfPlumberAdapter(PdfProcessorPort):
             List[TermOccurrence]: List of found occurrences
         """
         try:
-            # Load document content
-            document_content = self.file_storage.read_file(document.path)
             occurrences = []
-            
-            # Open PDF with pdfplumber
-            with pdfplumber.open(io.BytesIO(document_content)) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    # Extract words with positioning information
-                    words = page.extract_words()
-                    
-                    # Handle both single terms and multi-word terms
-                    term_text = term.text.lower()
-                    term_words = term.text.split()
-                    
-                    if len(term_words) == 1:
-                        # Single word/part of word search - use substring matching
-                        for word in words:
-                            if term_text in word['text'].lower():
-                                # Found a word containing our term
-                                # Calculate precise coordinates for the substring using proportional positioning
-                                word_text = word['text']
-                                term_pos = word_text.lower().find(term_text)
-                                
-                                if term_pos != -1:
-                                    # Calculate proportional width of the term within the word
-                                    word_width = word['x1'] - word['x0']
-                                    term_width = len(term_text) / len(word_text) * word_width
-                                    
-                                    # Calculate the starting position of the term
-                                    term_start_ratio = term_pos / len(word_text)
-                                    term_x0 = word['x0'] + (term_start_ratio * word_width)
-                                    term_x1 = term_x0 + term_width
-                                    
-                                    x0, y0, x1, y1 = term_x0, word['top'], term_x1, word['bottom']
-                                else:
-                                    # Fallback to word bounds if term not found
-                                    x0, y0, x1, y1 = word['x0'], word['top'], word['x1'], word['bottom']
-                                
-                                position = Position(x0=x0, y0=y0, x1=x1, y1=y1)
-                                
-                                occurrence = TermOccurrence(
-                                    term=term,
-                                    position=position,
-                                    page_number=page_num + 1
-                                )
-                                occurrences.append(occurrence)
-                    else:
-                        # Multi-word search - handle both single-line and multi-line terms
-                        # First try consecutive words on same line
-                        consecutive_found = False
-                        for i in range(len(words) - len(term_words) + 1):
-                            # Check if the next words match our term
-                            match = True
-                            for j, term_word in enumerate(term_words):
-                                if i + j >= len(words) or words[i + j]['text'].lower() != term_word.lower():
-                                    match = False
-                                    break
-                            
-                            if match:
-                                # Found consecutive words that match our term
-                                consecutive_found = True
-                                
-                                # Calculate bounding box from all matching words
-                                matching_words = words[i:i + len(term_words)]
-                                x0 = min(word['x0'] for word in matching_words)
-                                y0 = min(word['top'] for word in matching_words)
-                                x1 = max(word['x1'] for word in matching_words)
-                                y1 = max(word['bottom'] for word in matching_words)
-                                
-                                position = Position(x0=x0, y0=y0, x1=x1, y1=y1)
-                                
-                                occurrence = TermOccurrence(
-                                    term=term,
-                                    position=position,
-                                    page_number=page_num + 1
-                                )
-                                occurrences.append(occurrence)
-                        
-                        # If consecutive words not found, try multi-line search with column awareness
-                        if not consecutive_found:
-                            # Group words by columns to avoid mixing content from different columns
-                            columns = self._group_words_by_columns(words)
-                            
-                            # Search within each column separately
-                            for column_words in columns:
-                                if len(column_words) >= len(term_words):
-                                    # Try to find the term within this column
-                                    column_occurrences = self._find_term_in_column(column_words, term_words, term_text, page_num + 1)
-                                    occurrences.extend(column_occurrences)
+            for page_num, (words, lowered_texts) in enumerate(self._get_document_words(document)):
+                occurrences.extend(self._search_page_words(words, lowered_texts, term, page_num + 1))
             
             return occurrences
             
         except Exception as e:
             raise DocumentProcessingError(f"Error during text extraction with pdfplumber: {str(e)}")
     
+    def extract_all_occurrences(self, document: Document, terms: List[Term]) -> List[TermOccurrence]:
+        """
+        Extract the occurrences of several terms, extracting the words of each page only once.
+        
+        Args:
+            document: Document to analyze
+            terms: Terms to search for
+            
+        Returns:
+            List[TermOccurrence]: Found occurrences, grouped by term in the order of terms
+        """
+        try:
+            occurrences_by_term: List[List[TermOccurrence]] = [[] for _ in terms]
+            
+            for page_num, (words, lowered_texts) in enumerate(self._get_document_words(document)):
+                for term_occurrences, term in zip(occurrences_by_term, terms):
+                    term_occurrences.extend(self._search_page_words(words, lowered_texts, term, page_num + 1))
+            
+            return [occurrence for term_occurrences in occurrences_by_term for occurrence in term_occurrences]
+            
+        except Exception as e:
+            raise DocumentProcessingError(f"Error during text extraction with pdfplumber: {str(e)}")
+    
+    def _get_document_words(self, document: Document) -> List[Tuple[List[dict], List[str]]]:
+        """
+        Get the words of every page, reusing those of a recent search when the
+        document has not changed since.
+        
+        Args:
+            document: Document to read
+            
+        Returns:
+            Words and lowercased word texts of each page
+        """
+        cache_key = self._get_cache_key(document)
+        if cache_key is not None:
+            with self._words_cache_lock:
+                cached = self._words_cache.get(cache_key)
+                if cached is not None and (document.data is None or cached[0] == document.data):
+                    self._words_cache.move_to_end(cache_key)
+                    return cached[1]
+        
+        document_content = document.data if document.data is not None else self.file_storage.read_file(document.path)
+        with pdfplumber.open(io.BytesIO(document_content)) as pdf:
+            document_words = [self._extract_page_words(page) for page in pdf.pages]
+        
+        if cache_key is not None:
+            with self._words_cache_lock:
+                self._words_cache[cache_key] = (document.data, document_words)
+                while len(self._words_cache) > self._WORDS_CACHE_SIZE:
+                    self._words_cache.popitem(last=False)
+        
+        return document_words
+    
+    def _get_cache_key(self, document: Document) -> Optional[Tuple[str, Hashable]]:
+        """
+        Identify a version of a document (None if it cannot be identified cheaply).
+        
+        Args:
+            document: Document to identify
+            
+        Returns:
+            Optional[Tuple[str, Hashable]]: Path and content signature of the document
+        """
+        if document.data is not None:
+            # Supplied content: identified by its hash, confirmed by comparison on a hit
+            return document.path, ("data", len(document.data), hash(document.data))
+        signature = self.file_storage.get_file_signature(document.path)
+        if signature is None:
+            return None
+        return document.path, signature
+    
+    def _extract_page_words(self, page) -> tuple[List[dict], List[str]]:
+        """
+        Extract the words of a page with their positions.
+        
+        Args:
+            page: pdfplumber page
+            
+        Returns:
+            Words with positioning information, and their lowercased texts
+        """
+        words = page.extract_words()
+        # Lowercase every word once per page instead of once per comparison
+        return words, [word['text'].lower() for word in words]
+    
+    def _search_page_words(self, words: List[dict], lowered_texts: List[str], term: Term, page_number: int) -> List[TermOccurrence]:
+        """
+        Find the occurrences of a term among the words of a page.
+        
+        Args:
+            words: Words of the page with positioning information
+            lowered_texts: Lowercased text of each word
+            term: Term to search for
+            page_number: Page number (from 1)
+            
+        Returns:
+            List[TermOccurrence]: Occurrences found on the page
+        """
+        occurrences = []
+        
+        # Handle both single terms and multi-word terms
+        term_text = term.text.lower()
+        term_words = term.text.split()
+        lowered_term_words = [term_word.lower() for term_word in term_words]
+        
+        if len(term_words) == 1:
+            # Single word/part of word search - use substring matching
+            for word, word_lower in zip(words, lowered_texts):
+                if term_text in word_lower:
+                    # Found a word containing our term
+                    # Calculate precise coordinates for the substring using proportional positioning
+                    word_text = word['text']
+                    term_pos = word_lower.find(term_text)
+                    
+                    if term_pos != -1:
+                        # Calculate proportional width of the term within the word
+                        word_width = word['x1'] - word['x0']
+                        term_width = len(term_text) / len(word_text) * word_width
+                        
+                        # Calculate the starting position of the term
+                        term_start_ratio = term_pos / len(word_text)
+                        term_x0 = word['x0'] + (term_start_ratio * word_width)
+                        term_x1 = term_x0 + term_width
+                        
+                        x0, y0, x1, y1 = term_x0, word['top'], term_x1, word['bottom']
+                    else:
+                        # Fallback to word bounds if term not found
+                        x0, y0, x1, y1 = word['x0'], word['top'], word['x1'], word['bottom']
+                    
+                    position = Position(x0=x0, y0=y0, x1=x1, y1=y1)
+                    
+                    occurrence = TermOccurrence(
+                        term=term,
+                        position=position,
+                        page_number=page_number
+                    )
+                    occurrences.append(occurrence)
+        else:
+            # Multi-word search - handle both single-line and multi-line terms
+            # First try consecutive words on same line
+            consecutive_found = False
+            first_term_word = lowered_term_words[0]
+            term_word_count = len(lowered_term_words)
+            for i in range(len(words) - term_word_count + 1):
+                # Most windows fail on the first word, check it alone first
+                if lowered_texts[i] != first_term_word:
+                    continue
+                
+                # Check if the next words match our term
+                if all(lowered_texts[i + j] == lowered_term_words[j] for j in range(1, term_word_count)):
+                    # Found consecutive words that match our term
+                    consecutive_found = True
+                    
+                    # Calculate bounding box from all matching words
+                    matching_words = words[i:i + term_word_count]
+                    x0 = min(word['x0'] for word in matching_words)
+                    y0 = min(word['top'] for word in matching_words)
+                    x1 = max(word['x1'] for word in matching_words)
+                    y1 = max(word['bottom'] for word in matching_words)
+                    
+                    position = Position(x0=x0, y0=y0, x1=x1, y1=y1)
+                    
+                    occurrence = TermOccurrence(
+                        term=term,
+                        position=position,
+                        page_number=page_number
+                    )
+                    occurrences.append(occurrence)
+            
+            # If consecutive words not found, try multi-line search with column awareness
+            if not consecutive_found:
+                # Group words by columns to avoid mixing content from different columns
+                columns = self._group_words_by_columns(words)
+                
+                # Search within each column separately
+                for column_words in columns:
+                    if len(column_words) >= len(term_words):
+                        # Try to find the term within this column
+                        column_occurrences = self._find_term_in_column(column_words, term_words, term_text, page_number)
+                        occurrences.extend(column_occurrences)
+        
+        return occurrences
+    
     def _group_words_by_columns(self, words: List[dict]) -> List[List[dict]]:
         """
         Group words by columns based on their x-coordinates to avoid mixing content from different columns.
@@ -247,7 +355,7 @@ class PdfPlumberAdapter(PdfProcessorPort):
         """
         try:
             # Load document content
-            document_content = self.file_storage.read_file(document.path)
+            document_content = document.data if document.data is not None else self.file_storage.read_file(document.path)
             
             # Group occurrences by page
             occurrences_by_page = {}
@@ -257,13 +365,6 @@ class PdfPlumberAdapter(PdfProcessorPort):
                     occurrences_by_page[page_num] = []
                 occurrences_by_page[page_num].append(occurrence)
             
-            # Convert PDF to images using pdf2image
-            images = convert_from_bytes(
-                document_content,
-                dpi=200,  # High resolution for better quality
-                fmt='PNG'
-            )
-            
             # Get page information from pdfplumber for accurate coordinate conversion
             page_info_list = []
             with pdfplumber.open(io.BytesIO(document_content)) as pdf:
@@ -274,24 +375,38 @@ class PdfPlumberAdapter(PdfProcessorPort):
                         'bbox': page.bbox
                     })
             
-            # Process each page
-            processed_images = []
-            for page_num, image in enumerate(images):
-                if page_num in occurrences_by_page:
-                    # Apply obfuscation to this page
-                    page_info = page_info_list[page_num] if page_num < len(page_info_list) else None
-                    processed_image = self._apply_obfuscation_to_image(
-                        image, 
-                        occurrences_by_page[page_num],
-                        page_info
-                    )
-                else:
-                    processed_image = image
+            with tempfile.TemporaryDirectory() as temp_dir:
+                # Render pages to disk so only one page image is held in memory at a time
+                image_paths = convert_from_bytes(
+                    document_content,
+                    dpi=200,  # High resolution for better quality
+                    fmt='ppm',  # Raw pixels, no zlib encode/decode round-trip
+                    thread_count=os.cpu_count() or 1,
+                    output_folder=temp_dir,
+                    paths_only=True
+                )
+                output_path = os.path.join(temp_dir, 'obfuscated.pdf')
                 
-                processed_images.append(processed_image)
-            
-            # Convert back to PDF using Pillow
-            return self._images_to_pdf(processed_images)
+                # Process each page and stream it into the output PDF
+                for page_num, image_path in enumerate(image_paths):
+                    with Image.open(image_path) as image:
+                        if page_num in occurrences_by_page:
+                            # Apply obfuscation to this page
+                            page_info = page_info_list[page_num] if page_num < len(page_info_list) else None
+                            processed_image = self._apply_obfuscation_to_image(
+                                image, 
+                                occurrences_by_page[page_num],
+                                page_info
+                            )
+                        else:
+                            processed_image = image
+                        
+                        self._append_image_to_pdf(processed_image, output_path, append=page_num > 0)
+                    os.remove(image_path)
+                
+                # Convert back to PDF bytes
+                with open(output_path, 'rb') as output_file:
+                    return output_file.read()
             
         except Exception as e:
             raise DocumentProcessingError(f"Error during obfuscation: {str(e)}")
@@ -299,6 +414,7 @@ class PdfPlumberAdapter(PdfProcessorPort):
     def _apply_obfuscation_to_image(self, image: Image.Image, occurrences: List[TermOccurrence], page_info: dict | None = None) -> Image.Image:
         """
         Apply obfuscation to a single image page with corrected coordinate mapping.
+        The image is modified in place; callers do not keep the unmasked page.
         
         Args:
             image: PIL Image to process
@@ -306,35 +422,39 @@ class PdfPlumberAdapter(PdfProcessorPort):
             page_info: Page information from pdfplumber for accurate coordinate conversion
             
         Returns:
-            Image.Image: Processed image
+            Image.Image: Processed image (the same object as image)
         """
-        # Create a copy to avoid modifying original
-        processed_image = image.copy()
+        # Draw directly on the page image, no full-size copy needed
+        processed_image = image
         draw = ImageDraw.Draw(processed_image)
         
         img_width, img_height = image.size
         
+        # Get page dimensions from pdfplumber
+        if page_info:
+            page_width_pt = page_info['width']
+            page_height_pt = page_info['height']
+            page_bbox = page_info['bbox']
+        else:
+            # Fallback to A4 dimensions
+            page_width_pt = 595.5
+            page_height_pt = 842.25
+            page_bbox = (0, 0, page_width_pt, page_height_pt)
+        
+        # Extract bbox coordinates
+        bbox_x0, bbox_y0, bbox_x1, bbox_y1 = page_bbox
+        
+        # Calculate scale factors based on actual dimensions
+        # Page PDF: 595.5 x 842.25 points
+        # Image: 1655 x 2340 pixels
+        scale_x = img_width / page_width_pt
+        scale_y = img_height / page_height_pt
+        
+        # Add bbox offset height to rectangle for better coverage
+        bbox_offset_height = abs(bbox_y0)  # Absolute value of bbox offset
+        bbox_offset_pixels = int(bbox_offset_height * scale_y)
+        
         for occurrence in occurrences:
-            # Get page dimensions from pdfplumber
-            if page_info:
-                page_width_pt = page_info['width']
-                page_height_pt = page_info['height']
-                page_bbox = page_info['bbox']
-            else:
-                # Fallback to A4 dimensions
-                page_width_pt = 595.5
-                page_height_pt = 842.25
-                page_bbox = (0, 0, page_width_pt, page_height_pt)
-            
-            # Extract bbox coordinates
-            bbox_x0, bbox_y0, bbox_x1, bbox_y1 = page_bbox
-            
-            # Calculate scale factors based on actual dimensions
-            # Page PDF: 595.5 x 842.25 points
-            # Image: 1655 x 2340 pixels
-            scale_x = img_width / page_width_pt
-            scale_y = img_height / page_height_pt
-            
             # Convert pdfplumber coordinates to image coordinates
             # pdfplumber uses (x0, y0, x1, y1) where y0 is bottom, y1 is top
             # image uses (x, y) where y=0 is top
@@ -362,10 +482,6 @@ class PdfPlumberAdapter(PdfProcessorPort):
             x0, x1 = min(x0, x1), max(x0, x1)
             y0_img, y1_img = min(y0_img, y1_img), max(y0_img, y1_img)
             
-            # Add bbox offset height to rectangle for better coverage
-            bbox_offset_height = abs(bbox_y0)  # Absolute value of bbox offset
-            bbox_offset_pixels = int(bbox_offset_height * scale_y)
-            
             # Extend rectangle height only above (not below)
             y0_img = max(0, y0_img - bbox_offset_pixels)
             
@@ -374,47 +490,20 @@ class PdfPlumberAdapter(PdfProcessorPort):
         
         return processed_image
     
-    def _images_to_pdf(self, images: List[Image.Image]) -> bytes:
+    def _append_image_to_pdf(self, image: Image.Image, output_path: str, append: bool) -> None:
         """
-        Convert list of PIL images back to PDF using Pillow.
+        Write a PIL image as a new page of a PDF file using Pillow.
         Preserves original page dimensions.
         
         Args:
-            images: List of PIL Images
-            
-        Returns:
-            bytes: PDF content
+            image: PIL Image of the page
+            output_path: Path of the PDF file to write
+            append: If True, add the page to the existing file instead of creating it
         """
-        # Convert images to PDF using Pillow with original dimensions
-        if len(images) == 1:
-            # Single page - preserve original dimensions
-            output_buffer = io.BytesIO()
-            # Convert to RGB if needed (PDF requires RGB)
-            if images[0].mode != 'RGB':
-                images[0] = images[0].convert('RGB')
-            images[0].save(output_buffer, format='PDF', resolution=200.0)
-            output_buffer.seek(0)
-            return output_buffer.getvalue()
-        else:
-            # Multiple pages - preserve original dimensions
-            output_buffer = io.BytesIO()
-            # Convert all images to RGB if needed
-            rgb_images = []
-            for img in images:
-                if img.mode != 'RGB':
-                    rgb_images.append(img.convert('RGB'))
-                else:
-                    rgb_images.append(img)
-            
-            rgb_images[0].save(
-                output_buffer, 
-                format='PDF', 
-                save_all=True, 
-                append_images=rgb_images[1:],
-                resolution=200.0
-            )
-            output_buffer.seek(0)
-            return output_buffer.getvalue()
+        # Convert to RGB if needed (PDF requires RGB)
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        image.save(output_path, format='PDF', append=append, resolution=200.0)
     
     def get_engine_info(self) -> dict:
         """
@@ -3,7 +3,7 @@ try:
 except ImportError:
     raise ImportError("PyMuPDF is required. Install with: pip install PyMuPDF")
 
-from typing import List
+from typing import Callable, List, Optional
 from src.ports.pdf_processor_port import PdfProcessorPort
 from src.domain.entities import Document, Term, TermOccurrence, Position
 from src.domain.exceptions import DocumentProcessingError
@@ -13,9 +13,17 @@ from src.ports.file_storage_port import FileStoragePort
 class PyMuPdfAdapter(PdfProcessorPort):
     """PyMuPDF adapter for PDF processing."""
     
-    def __init__(self, file_storage: FileStoragePort):
-        """Initialize the adapter with a storage system."""
+    def __init__(self, file_storage: FileStoragePort, flatten: bool = False):
+        """
+        Initialize the adapter with a storage system.
+        
+        Args:
+            file_storage: Storage system used to read documents
+            flatten: If True, additionally rasterize every page after redaction
+                (paranoid mode, much slower and produces image-only PDFs)
+        """
         self.file_storage = file_storage
+        self.flatten = flatten
     
     def extract_text_occurrences(self, document: Document, term: Term) -> List[TermOccurrence]:
         """
@@ -30,102 +38,252 @@ class PyMuPdfAdapter(PdfProcessorPort):
         """
         try:
             # Load document content
-            document_content = self.file_storage.read_file(document.path)
-            pdf_doc = fitz.open(stream=document_content, filetype="pdf")
+            document_content = document.data if document.data is not None else self.file_storage.read_file(document.path)
             occurrences = []
             
-            for page_num in range(len(pdf_doc)):
-                page = pdf_doc[page_num]
-                
-                # Case insensitive search - search for all variations
-                variations = [term.text, term.text.lower(), term.text.upper(), term.text.capitalize()]
-                text_instances = []
-                for variation in variations:
-                    instances = page.search_for(variation)
-                    text_instances.extend(instances)
-                
-                # Remove duplicates based on coordinates
-                seen = set()
-                unique_instances = []
-                for inst in text_instances:
-                    inst_tuple = (inst.x0, inst.y0, inst.x1, inst.y1)
-                    if inst_tuple not in seen:
-                        seen.add(inst_tuple)
-                        unique_instances.append(inst)
-                text_instances = unique_instances
-                
-                for rect in text_instances:
-                    position = Position(
-                        x0=rect.x0,
-                        y0=rect.y0,
-                        x1=rect.x1,
-                        y1=rect.y1
-                    )
-                    occurrence = TermOccurrence(
-                        term=term,
-                        position=position,
-                        page_number=page_num + 1  # Pages numbered from 1
-                    )
-                    occurrences.append(occurrence)
+            with fitz.open(stream=document_content, filetype="pdf") as pdf_doc:
+                for page_num in range(len(pdf_doc)):
+                    page = pdf_doc[page_num]
+                    occurrences.extend(self._search_page(page, page.get_textpage(), term, page_num + 1))
             
-            pdf_doc.close()
             return occurrences
             
         except Exception as e:
             raise DocumentProcessingError(f"Error during text extraction: {str(e)}")
     
+    def extract_all_occurrences(self, document: Document, terms: List[Term]) -> List[TermOccurrence]:
+        """
+        Extract the occurrences of several terms, opening the document and loading each page only once.
+        
+        Args:
+            document: Document to analyze
+            terms: Terms to search for
+            
+        Returns:
+            List[TermOccurrence]: Found occurrences, grouped by term in the order of terms
+        """
+        try:
+            document_content = document.data if document.data is not None else self.file_storage.read_file(document.path)
+            with fitz.open(stream=document_content, filetype="pdf") as pdf_doc:
+                return self._search_document(pdf_doc, terms)
+            
+        except Exception as e:
+            raise DocumentProcessingError(f"Error during text extraction: {str(e)}")
+    
+    def find_and_obfuscate_to(
+        self,
+        document: Document,
+        terms: List[Term],
+        dest_path: str,
+        select_occurrences: Optional[Callable[[List[TermOccurrence]], List[TermOccurrence]]] = None
+    ) -> List[TermOccurrence]:
+        """
+        Search and redact the terms on a single opened instance of the document,
+        then save it directly to a local file.
+        
+        Args:
+            document: Document to obfuscate
+            terms: Terms to search for
+            dest_path: Local file system path of the obfuscated document
+            select_occurrences: Chooses the found occurrences to mask (default: all)
+            
+        Returns:
+            List[TermOccurrence]: All found occurrences, grouped by term in the order of terms
+        """
+        if self.flatten:
+            # Flattening builds a new document in memory anyway
+            return super().find_and_obfuscate_to(document, terms, dest_path, select_occurrences)
+        
+        try:
+            document_content = document.data if document.data is not None else self.file_storage.read_file(document.path)
+            with fitz.open(stream=document_content, filetype="pdf") as pdf_doc:
+                occurrences = self._search_document(pdf_doc, terms)
+                occurrences_to_mask = select_occurrences(occurrences) if select_occurrences is not None else occurrences
+                if occurrences_to_mask:
+                    self._apply_redactions(pdf_doc, occurrences_to_mask)
+                    pdf_doc.save(dest_path, deflate=True, garbage=4)
+            
+            return occurrences
+            
+        except Exception as e:
+            raise DocumentProcessingError(f"Error during obfuscation: {str(e)}")
+    
+    def _search_document(self, pdf_doc: fitz.Document, terms: List[Term]) -> List[TermOccurrence]:
+        """
+        Find the occurrences of several terms in an opened document, loading each page once.
+        
+        Args:
+            pdf_doc: Opened document
+            terms: Terms to search for
+            
+        Returns:
+            List[TermOccurrence]: Found occurrences, grouped by term in the order of terms
+        """
+        occurrences_by_term: List[List[TermOccurrence]] = [[] for _ in terms]
+        
+        for page_num in range(len(pdf_doc)):
+            page = pdf_doc[page_num]
+            # Parse the page text once for all searches
+            text_page = page.get_textpage()
+            for term_occurrences, term in zip(occurrences_by_term, terms):
+                term_occurrences.extend(self._search_page(page, text_page, term, page_num + 1))
+        
+        return [occurrence for term_occurrences in occurrences_by_term for occurrence in term_occurrences]
+    
+    def _search_page(self, page: "fitz.Page", text_page: "fitz.TextPage", term: Term, page_number: int) -> List[TermOccurrence]:
+        """
+        Find the occurrences of a term on a page.
+        
+        Args:
+            page: Page to search
+            text_page: Text of the page, shared by all the searches on it
+            term: Term to search for
+            page_number: Page number (from 1)
+            
+        Returns:
+            List[TermOccurrence]: Occurrences found on the page
+        """
+        # Case insensitive search - search for all variations
+        variations = [term.text, term.text.lower(), term.text.upper(), term.text.capitalize()]
+        text_instances = []
+        for variation in variations:
+            instances = page.search_for(variation, textpage=text_page)
+            text_instances.extend(instances)
+        
+        # Remove duplicates based on coordinates
+        seen = set()
+        occurrences = []
+        for rect in text_instances:
+            inst_tuple = (rect.x0, rect.y0, rect.x1, rect.y1)
+            if inst_tuple not in seen:
+                seen.add(inst_tuple)
+                occurrences.append(TermOccurrence(
+                    term=term,
+                    position=Position(x0=rect.x0, y0=rect.y0, x1=rect.x1, y1=rect.y1),
+                    page_number=page_number
+                ))
+        
+        return occurrences
+    
+    def probe(self, document: Document) -> None:
+        """
+        Check that the document can be opened, without scanning its text.
+        
+        Args:
+            document: Document to check
+            
+        Raises:
+            DocumentProcessingError: If the document cannot be opened or has no pages
+        """
+        try:
+            document_content = document.data if document.data is not None else self.file_storage.read_file(document.path)
+            with fitz.open(stream=document_content, filetype="pdf") as pdf_doc:
+                page_count = pdf_doc.page_count
+        except Exception as e:
+            raise DocumentProcessingError(f"Error opening document {document.path}: {str(e)}")
+        if page_count == 0:
+            raise DocumentProcessingError(f"Document {document.path} has no pages")
+    
     def obfuscate_occurrences(self, document: Document, occurrences: List[TermOccurrence]) -> bytes:
         """
         Obfuscate the document by masking occurrences with gray rectangles.
-        Obfuscation is made permanent by flattening (image conversion).
+        Obfuscation is made permanent by applying redactions, which removes
+        the underlying text from the content stream. Rasterization of every
+        page is only performed when the adapter was created with flatten=True.
         
         Args:
             document: Document to obfuscate
             occurrences: List of occurrences to mask
             
         Returns:
-            bytes: Obfuscated and flattened PDF document (irreversible)
+            bytes: Obfuscated PDF document (irreversible)
         """
         try:
-            # Load document content
-            document_content = self.file_storage.read_file(document.path)
-            pdf_doc = fitz.open(stream=document_content, filetype="pdf")
-            
-            # Group occurrences by page
-            occurrences_by_page = {}
-            for occurrence in occurrences:
-                page_num = occurrence.page_number - 1  # PyMuPDF uses 0-based index
-                if page_num not in occurrences_by_page:
-                    occurrences_by_page[page_num] = []
-                occurrences_by_page[page_num].append(occurrence)
-            
-            # Add gray rectangles on each occurrence (NO BORDERS)
-            for page_num, page_occurrences in occurrences_by_page.items():
-                page = pdf_doc[page_num]
-                
-                for occurrence in page_occurrences:
-                    rect = fitz.Rect(
-                        occurrence.position.x0,
-                        occurrence.position.y0,
-                        occurrence.position.x1,
-                        occurrence.position.y1
-                    )
-                    
-                    # Add gray rectangle WITHOUT border to mask text
-                    annot = page.add_rect_annot(rect)
-                    annot.set_colors(stroke=[0.5, 0.5, 0.5], fill=[0.5, 0.5, 0.5])  # Uniform gray
-                    annot.set_opacity(1.0)  # Opaque
-                    annot.update()
-            
-            # CRITICAL STEP: Flattening to make obfuscation irreversible
-            flattened_content = self._flatten_pdf_content(pdf_doc)
-            pdf_doc.close()
+            with self._redact_document(document, occurrences) as pdf_doc:
+                if self.flatten:
+                    return self._flatten_pdf_content(pdf_doc)
+                return pdf_doc.tobytes(deflate=True, garbage=4)
             
-            return flattened_content
+        except Exception as e:
+            raise DocumentProcessingError(f"Error during obfuscation: {str(e)}")
+    
+    def obfuscate_occurrences_to(self, document: Document, occurrences: List[TermOccurrence], dest_path: str) -> None:
+        """
+        Obfuscate the document and save it directly to a local file,
+        without serializing the whole result in memory first.
+        
+        Args:
+            document: Document to obfuscate
+            occurrences: List of occurrences to mask
+            dest_path: Local file system path of the obfuscated document
+        """
+        if self.flatten:
+            # Flattening builds a new document in memory anyway
+            super().obfuscate_occurrences_to(document, occurrences, dest_path)
+            return
+        
+        try:
+            with self._redact_document(document, occurrences) as pdf_doc:
+                pdf_doc.save(dest_path, deflate=True, garbage=4)
             
         except Exception as e:
             raise DocumentProcessingError(f"Error during obfuscation: {str(e)}")
     
+    def _redact_document(self, document: Document, occurrences: List[TermOccurrence]) -> fitz.Document:
+        """
+        Open the document and apply gray redactions on the occurrences.
+        
+        Args:
+            document: Document to obfuscate
+            occurrences: List of occurrences to mask
+            
+        Returns:
+            fitz.Document: Redacted document, to be closed by the caller
+        """
+        # Load document content
+        document_content = document.data if document.data is not None else self.file_storage.read_file(document.path)
+        pdf_doc = fitz.open(stream=document_content, filetype="pdf")
+        
+        try:
+            self._apply_redactions(pdf_doc, occurrences)
+        except Exception:
+            pdf_doc.close()
+            raise
+        
+        return pdf_doc
+    
+    def _apply_redactions(self, pdf_doc: fitz.Document, occurrences: List[TermOccurrence]) -> None:
+        """
+        Apply gray redactions on the occurrences of an opened document.
+        
+        Args:
+            pdf_doc: Opened document, modified in place
+            occurrences: List of occurrences to mask
+        """
+        # Group occurrences by page
+        occurrences_by_page = {}
+        for occurrence in occurrences:
+            page_num = occurrence.page_number - 1  # PyMuPDF uses 0-based index
+            if page_num not in occurrences_by_page:
+                occurrences_by_page[page_num] = []
+            occurrences_by_page[page_num].append(occurrence)
+        
+        # Add gray redaction areas on each occurrence, then apply them
+        for page_num, page_occurrences in occurrences_by_page.items():
+            page = pdf_doc[page_num]
+            
+            for occurrence in page_occurrences:
+                rect = fitz.Rect(
+                    occurrence.position.x0,
+                    occurrence.position.y0,
+                    occurrence.position.x1,
+                    occurrence.position.y1
+                )
+                page.add_redact_annot(rect, fill=(0.5, 0.5, 0.5))  # Uniform gray
+            
+            # CRITICAL STEP: remove the underlying text for good
+            page.apply_redactions(images=fitz.PDF_REDACT_IMAGE_NONE)
+    
     def _flatten_pdf_content(self, doc: fitz.Document) -> bytes:
         """
         Flatten the PDF by converting each page to image then to PDF.
@@ -180,10 +338,10 @@ class PyMuPdfAdapter(PdfProcessorPort):
             return {
                 "name": "pymupdf",
                 "version": fitz.VersionBind,
-                "description": "PyMuPDF - Fast and reliable engine for rectangle overlay obfuscation",
+                "description": "PyMuPDF - Fast and reliable engine for redaction-based obfuscation",
                 "features": [
                     "Text extraction",
-                    "Rectangle overlay obfuscation", 
+                    "Redaction-based obfuscation",
                     "Multi-page support",
                     "High performance"
                 ],
@@ -1,218 +1,591 @@
 """
-This adapter uses pypdfium2 for text extraction and PIL+ReportLab for obfuscation.
+This adapter uses pypdfium2 for text extraction and pypdfium2+PIL for obfuscation.
 Robust implementation using raster approach for maximum compatibility.
 """
 import io
+import logging
 import tempfile
 import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
 import pypdfium2 as pdfium
-from PIL import Image, ImageDraw
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
+import pypdfium2.raw as pdfium_c
+from PIL import Image
 
 from ..domain.entities import Document, Term, TermOccurrence, Position
 from ..domain.exceptions import DocumentProcessingError
 from ..ports.pdf_processor_port import PdfProcessorPort
 from ..ports.file_storage_port import FileStoragePort
-from typing import List
+from typing import Hashable, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Document opened once per worker process by _init_render_worker
+_worker_pdf = None
+
+# Render scales (1.0 = 72 DPI) and the page share above which an image counts as a scan
+_OUTPUT_SCALE = 2.5
+_MIN_SCALE = 1.0
+_SCAN_COVERAGE = 0.5
+
+# Starting worker processes costs more than rendering a few pages in-process,
+# so documents with fewer pages to rasterize are always rendered in-process
+_MIN_PAGES_FOR_PROCESSES = 16
+
+
+def _init_render_worker(pdf_content: bytes) -> None:
+    """Open the document once in a render worker process."""
+    global _worker_pdf
+    _worker_pdf = pdfium.PdfDocument(pdf_content)
+
+
+def _render_and_mask_page(page_index: int, rects: List[Tuple[float, float, float, float]], grayscale: bool) -> Tuple[bytes, float, float]:
+    """Worker entry point: render, mask and encode one page of the worker's document."""
+    image, page_width, page_height = _render_page_with_masks(_worker_pdf, page_index, rects, grayscale)
+    return _encode_page_image(image), page_width, page_height
+
+
+def _choose_render_scale(page: pdfium.PdfPage, page_width: float, page_height: float) -> float:
+    """
+    Choose the render scale for a page from its content.
+    
+    Pages dominated by a scanned image are rendered at the image's native
+    resolution (never above _OUTPUT_SCALE), since rendering them finer only
+    upsamples the scan. Other pages are rendered at _OUTPUT_SCALE.
+    
+    Args:
+        page: Page to inspect
+        page_width: Page width in points
+        page_height: Page height in points
+        
+    Returns:
+        float: Render scale (1.0 = 72 DPI)
+    """
+    page_area = page_width * page_height
+    if page_area <= 0:
+        return _OUTPUT_SCALE
+    
+    for image_obj in page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE]):
+        try:
+            metadata = image_obj.get_metadata()
+        except Exception as e:
+            logger.debug("Unreadable image metadata, skipping: %s", e)
+            continue
+        if metadata.horizontal_dpi <= 0 or metadata.vertical_dpi <= 0:
+            continue
+        
+        # Area covered by the image on the page, in points
+        shown_width = metadata.width / metadata.horizontal_dpi * 72
+        shown_height = metadata.height / metadata.vertical_dpi * 72
+        if shown_width * shown_height >= page_area * _SCAN_COVERAGE:
+            native_scale = min(metadata.horizontal_dpi, metadata.vertical_dpi) / 72
+            return max(_MIN_SCALE, min(_OUTPUT_SCALE, native_scale))
+    
+    return _OUTPUT_SCALE
+
+
+def _render_page_with_masks(pdf: pdfium.PdfDocument, page_index: int, rects: List[Tuple[float, float, float, float]], grayscale: bool = False) -> Tuple[Image.Image, float, float]:
+    """
+    Render a page and draw black rectangles over the given areas.
+    The page is rendered directly at the scale chosen by _choose_render_scale.
+    
+    Args:
+        pdf: Opened document
+        page_index: 0-based index of the page to render
+        rects: Areas to mask as (x0, y0, x1, y1) in PDF coordinates
+        grayscale: Render as 8-bit greyscale instead of RGB
+        
+    Returns:
+        Tuple[Image.Image, float, float]: Masked page image at output resolution,
+        page width and page height in points
+    """
+    page = pdf[page_index]
+    
+    # Page dimensions, queried once and reused for scaling and output size
+    page_width, page_height = page.get_size()
+    
+    scale = _choose_render_scale(page, page_width, page_height)
+    bitmap = page.render(
+        scale=scale, 
+        optimize_mode="print",  # Best quality for text
+        rotation=0,
+        grayscale=grayscale
+    )
+    # View on the bitmap's pixel buffer (no copy), shape (height, width[, channels])
+    pixels = bitmap.to_numpy()
+    
+    # Calculate scale factors for the rendered image
+    img_h, img_w = pixels.shape[:2]
+    scale_x = img_w / page_width
+    scale_y = img_h / page_height
+    
+    if rects:
+        # Get bbox information from pypdfium2 (only its origin is needed)
+        try:
+            bbox_x0, bbox_y0, _, _ = page.get_mediabox()
+        except Exception as e:
+            # Fallback to page dimensions
+            logger.debug("No usable mediabox on page %d, using page size: %s", page_index + 1, e)
+            bbox_x0, bbox_y0 = 0, 0
+        
+        # Convert all rectangles of the page to image coordinates in one pass
+        coords = np.asarray(rects, dtype=np.float64)
+        
+        # Apply bbox offset adjustment and scale X coordinates
+        xs0 = (coords[:, 0] - bbox_x0) * scale_x
+        xs1 = (coords[:, 2] - bbox_x0) * scale_x
+        
+        # Convert PDF coordinates to image coordinates, inverting the Y axis
+        ys0 = img_h - (coords[:, 3] - bbox_y0) * scale_y
+        ys1 = img_h - (coords[:, 1] - bbox_y0) * scale_y
+        
+        # Ensure coordinates are in correct order, then add bbox offset
+        # to rectangle height for better coverage (extend only above)
+        left = np.minimum(xs0, xs1)
+        right = np.maximum(xs0, xs1)
+        top = np.minimum(ys0, ys1) - abs(bbox_y0) * scale_y
+        bottom = np.maximum(ys0, ys1)
+        
+        # Pixel bounds, inclusive of the far edge and clipped to the image
+        boxes = np.stack([left, top, right + 1, bottom + 1], axis=1).astype(np.int64)
+        np.clip(boxes[:, 0::2], 0, img_w, out=boxes[:, 0::2])
+        np.clip(boxes[:, 1::2], 0, img_h, out=boxes[:, 1::2])
+        
+        # Drop boxes left empty by clipping, the remaining ones are filled in C by NumPy
+        boxes = boxes[(boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])]
+        
+        for x0, y0, x1, y1 in boxes.tolist():
+            # Fill black rectangle directly in the bitmap
+            pixels[y0:y1, x0:x1] = 0
+    
+    pil_image = bitmap.to_pil()
+    if pil_image.mode == "L":
+        # Greyscale images share the bitmap's buffer, detach before freeing it
+        pil_image = pil_image.copy()
+    
+    bitmap.close()
+    page.close()
+    del pixels, bitmap
+    
+    return pil_image, page_width, page_height
+
+
+def _encode_page_image(image: Image.Image) -> bytes:
+    """
+    Encode a page image as baseline JPEG, embedded as-is (DCTDecode) by the PDF writer.
+    Only uses Pillow, so it can run in a thread while PDFium renders another page.
+    
+    Args:
+        image: Page image, closed once encoded
+        
+    Returns:
+        bytes: JPEG data
+    """
+    img_buffer = io.BytesIO()
+    image.save(img_buffer, format='JPEG', quality=85, optimize=True, progressive=False)
+    image.close()
+    
+    return img_buffer.getvalue()
+
+
+def _insert_jpeg_page(pdf: pdfium.PdfDocument, jpeg_data: bytes, page_width: float, page_height: float) -> None:
+    """
+    Append a page showing a JPEG image over its whole area.
+    
+    Args:
+        pdf: Document to append the page to
+        jpeg_data: Encoded JPEG image
+        page_width: Page width in points
+        page_height: Page height in points
+    """
+    page = pdf.new_page(page_width, page_height)
+    image = pdfium.PdfImage.new(pdf)
+    # Embedded as-is (DCTDecode); the document keeps the buffer alive until it is closed
+    image.load_jpeg(io.BytesIO(jpeg_data), inline=False)
+    image.set_matrix(pdfium.PdfMatrix().scale(page_width, page_height))
+    page.insert_obj(image)
+    page.gen_content()
+    page.close()
+
+
+class _CachedDocument:
+    """Opened document shared between calls, closed once evicted and no longer in use."""
+    
+    def __init__(self, content: bytes, pdf: pdfium.PdfDocument, cached: bool = True):
+        self.content = content
+        self.pdf = pdf
+        # Number of calls currently holding the document (guarded by the cache lock)
+        self.users = 0
+        # Set when the document leaves the cache (or never entered it)
+        self.evicted = not cached
+        # Held for the whole time a call uses the document: PDFium objects are not thread-safe
+        self.lock = threading.Lock()
 
 
 class PyPdfium2Adapter(PdfProcessorPort):
     """
-    PyPDFium2 adapter for PDF processing with PIL+ReportLab obfuscation.
+    PyPDFium2 adapter for PDF processing with PIL-based raster obfuscation.
     """
     
-    def __init__(self, file_storage: FileStoragePort):
+    # Number of recently opened documents kept open between calls
+    _DOCUMENT_CACHE_SIZE = 4
+    
+    def __init__(self, file_storage: FileStoragePort, flatten: bool = True, max_workers: Optional[int] = None, grayscale: bool = False):
+        """
+        Initialize the adapter with a storage system.
+        
+        Args:
+            file_storage: Storage system used to read documents
+            flatten: If True (default), pages are rasterized so the masked text is
+                destroyed. If False, opaque vector rectangles are stamped over the
+                occurrences instead, which is much faster and keeps the document
+                vector, but leaves the underlying text in the content stream.
+            max_workers: Number of processes used to rasterize documents with at
+                least _MIN_PAGES_FOR_PROCESSES pages to mask (defaults to the CPU
+                count, capped at 6). 1 always renders in-process.
+            grayscale: Rasterize pages as 8-bit greyscale, a third of the memory
+                and encoding work of RGB, for documents without meaningful color.
+        """
         self._file_storage = file_storage
+        self._flatten = flatten
+        self._max_workers = max_workers or min(os.cpu_count() or 1, 6)
+        self._grayscale = grayscale
+        self._document_cache: "OrderedDict[Tuple[str, Hashable], _CachedDocument]" = OrderedDict()
+        self._document_cache_lock = threading.Lock()
 
     def extract_text_occurrences(self, document: Document, term: Term) -> List[TermOccurrence]:
         """
         Extract text occurrences using PyPDFium2 with improved bounding boxes from text rects.
         """
+        return self.extract_all_occurrences(document, [term])
+
+    def extract_all_occurrences(self, document: Document, terms: List[Term]) -> List[TermOccurrence]:
+        """
+        Extract the occurrences of all terms, building each page's text page only once.
+        """
         try:
-            pdf_content = self._file_storage.read_file(document.path)
-            pdf = pdfium.PdfDocument(pdf_content)
-            occurrences = []
+            occurrences_by_term = [[] for _ in terms]
             
-            for page_index in range(len(pdf)):
-                page = pdf[page_index]
-                text_page = page.get_textpage()
-                text_page.count_rects()  # Indispensable pour get_rect/get_index
-                
-                # Search for the term
-                searcher = text_page.search(term.text, match_case=False, match_whole_word=False)
-                
-                # Get unique occurrences
-                seen = set()
-                unique_results = []
-                result_index = 0
-                while True:
-                    result = searcher.get_next()
-                    if result is None:
-                        break
-                    start_index, count = result
+            with self._use_document(document) as (_, pdf):
+                for page_index in range(len(pdf)):
+                    page = pdf[page_index]
+                    text_page = page.get_textpage()
+                    text_page.count_rects()  # Indispensable pour get_rect/get_index
                     
-                    # Get charbox for the full match (word)
-                    char_left, char_bottom, char_right, char_top = text_page.get_charbox(start_index, loose=True)
-                    if count > 1:
-                        end_left, end_bottom, end_right, end_top = text_page.get_charbox(start_index + count - 1, loose=True)
-                        char_left = min(char_left, end_left)
-                        char_right = max(char_right, end_right)
-                        char_top = max(char_top, end_top)
-                        char_bottom = min(char_bottom, end_bottom)
-
-                    # Use only charbox coordinates - simple and direct approach
-                    # For each word, use the bounding box of all its characters
-                    left = min(char_left, char_right)
-                    right = max(char_left, char_right)
-                    top = max(char_top, char_bottom)
-                    bottom = min(char_top, char_bottom)
+                    for term, term_occurrences in zip(terms, occurrences_by_term):
+                        term_occurrences.extend(self._search_text_page(text_page, term, page_index + 1))
                     
-                    coord_tuple = (left, bottom, right, top)
-                    if coord_tuple not in seen:
-                        seen.add(coord_tuple)
-                        unique_results.append((start_index, count, left, bottom, right, top))
-                    result_index += 1
-                searcher.close()
-                
-                # Create occurrences
-                for start_index, count, left, bottom, right, top in unique_results:
-                    occurrence = TermOccurrence(
-                        term=term,
-                        position=Position(
-                            x0=left,
-                            y0=bottom,
-                            x1=right,
-                            y1=top
-                        ),
-                        page_number=page_index + 1
-                    )
-                    occurrences.append(occurrence)
-                
-                text_page.close()
-            pdf.close()
-            return occurrences
+                    text_page.close()
+            
+            # Keep occurrences grouped by term, as when searching one term at a time
+            return [occurrence for term_occurrences in occurrences_by_term for occurrence in term_occurrences]
         except Exception as e:
             raise DocumentProcessingError(f"Failed to extract text with pypdfium2: {str(e)}")
 
+    def _search_text_page(self, text_page: pdfium.PdfTextPage, term: Term, page_number: int) -> List[TermOccurrence]:
+        """
+        Find the occurrences of a term in an already loaded text page.
+        
+        Args:
+            text_page: Text page to search
+            term: Term to find
+            page_number: 1-based number of the page
+            
+        Returns:
+            List[TermOccurrence]: Occurrences found on the page
+        """
+        # Search for the term
+        searcher = text_page.search(term.text, match_case=False, match_whole_word=False)
+        
+        # Get unique occurrences, deduplicated on the (integer) character range
+        seen = set()
+        occurrences = []
+        while True:
+            result = searcher.get_next()
+            if result is None:
+                break
+            start_index, count = result
+            if (start_index, count) in seen:
+                continue
+            seen.add((start_index, count))
+            
+            # Get charbox for the full match (word)
+            char_left, char_bottom, char_right, char_top = text_page.get_charbox(start_index, loose=True)
+            if count > 1:
+                end_left, end_bottom, end_right, end_top = text_page.get_charbox(start_index + count - 1, loose=True)
+                char_left = min(char_left, end_left)
+                char_right = max(char_right, end_right)
+                char_top = max(char_top, end_top)
+                char_bottom = min(char_bottom, end_bottom)
+
+            # Use only charbox coordinates - simple and direct approach
+            # For each word, use the bounding box of all its characters
+            occurrences.append(TermOccurrence(
+                term=term,
+                position=Position(
+                    x0=min(char_left, char_right),
+                    y0=min(char_top, char_bottom),
+                    x1=max(char_left, char_right),
+                    y1=max(char_top, char_bottom)
+                ),
+                page_number=page_number
+            ))
+        searcher.close()
+        
+        return occurrences
+
     def obfuscate_occurrences(self, document: Document, occurrences: List[TermOccurrence]) -> bytes:
         """
-        Obfuscate using pypdfium2 rendering and PIL+ReportLab image processing.
-        High-resolution approach: work at high resolution for precision, then resize for optimal file size.
+        Obfuscate using pypdfium2 rendering and PIL image processing.
+        Only pages containing occurrences are rasterized; other pages are copied unchanged.
+        The masked page images are embedded as JPEG without re-encoding.
         """
+        if not self._flatten:
+            return self._obfuscate_with_vector_rectangles(document, occurrences)
+        
         try:
-            pdf_content = self._file_storage.read_file(document.path)
-            pdf = pdfium.PdfDocument(pdf_content)
-            
-            # Group occurrences by page
-            occ_by_page = {}
-            for occ in occurrences:
-                occ_by_page.setdefault(occ.page_number - 1, []).append(occ)
-            
-            # Create output PDF with ReportLab
-            output_buffer = io.BytesIO()
-            c = canvas.Canvas(output_buffer)
-            
-            for page_index in range(len(pdf)):
-                page = pdf[page_index]
-                
-                # Get page dimensions and bbox information
-                page_width = page.get_width()
-                page_height = page.get_height()
+            with self._use_document(document) as (pdf_content, pdf):
+                page_count = len(pdf)
                 
-                # Get bbox information from pypdfium2
-                try:
-                    bbox_x0, bbox_y0, bbox_x1, bbox_y1 = page.get_mediabox()
-                except:
-                    # Fallback to page dimensions
-                    bbox_x0, bbox_y0, bbox_x1, bbox_y1 = 0, 0, page_width, page_height
+                # Group occurrence rectangles by page as plain tuples (cheap to send to workers)
+                rects_by_page = {}
+                for occ in occurrences:
+                    rects_by_page.setdefault(occ.page_number - 1, []).append(
+                        (occ.position.x0, occ.position.y0, occ.position.x1, occ.position.y1)
+                    )
                 
-                # High-resolution rendering for maximum precision
-                scale = 5.0  # Very high resolution for precise obfuscation
-                bitmap = page.render(
-                    scale=scale, 
-                    optimize_mode="print",  # Best quality for text
-                    rotation=0
-                )
-                pil_image = bitmap.to_pil()
+                # Only pages with occurrences are rasterized, the others are copied as they are
+                pages_to_render = [page_index for page_index in range(page_count) if page_index in rects_by_page]
                 
-                # Calculate scale factors for high-resolution image
-                img_w, img_h = pil_image.size
-                scale_x = img_w / page_width
-                scale_y = img_h / page_height
+                # Build the output document page by page, in order
+                output_pdf = pdfium.PdfDocument.new()
+                copied_until = 0
                 
-                # Draw black rectangles for obfuscation at high resolution
-                draw = ImageDraw.Draw(pil_image)
+                def add_page(page_index: int, jpeg_data: bytes, page_width: float, page_height: float) -> None:
+                    nonlocal copied_until
+                    # Copy the untouched pages preceding this one as they are
+                    if copied_until < page_index:
+                        output_pdf.import_pages(pdf, list(range(copied_until, page_index)))
+                    _insert_jpeg_page(output_pdf, jpeg_data, page_width, page_height)
+                    copied_until = page_index + 1
                 
-                for occ in occ_by_page.get(page_index, []):
-                    # Apply bbox offset adjustment
-                    x0_adjusted = occ.position.x0 - bbox_x0
-                    y0_adjusted = occ.position.y0 - bbox_y0
-                    x1_adjusted = occ.position.x1 - bbox_x0
-                    y1_adjusted = occ.position.y1 - bbox_y0
-                    
-                    # Convert PDF coordinates to high-resolution image coordinates
-                    x0 = x0_adjusted * scale_x
-                    y0 = img_h - (y1_adjusted * scale_y)  # Invert Y axis
-                    x1 = x1_adjusted * scale_x
-                    y1 = img_h - (y0_adjusted * scale_y)  # Invert Y axis
-                    
-                    # Ensure coordinates are in correct order
-                    x0, x1 = min(x0, x1), max(x0, x1)
-                    y0, y1 = min(y0, y1), max(y0, y1)
+                try:
+                    if len(pages_to_render) >= _MIN_PAGES_FOR_PROCESSES and self._max_workers > 1:
+                        # PDFium is single-threaded: render pages in worker processes,
+                        # each one opening its own copy of the document
+                        with ProcessPoolExecutor(
+                            max_workers=min(self._max_workers, len(pages_to_render)),
+                            initializer=_init_render_worker,
+                            initargs=(pdf_content,)
+                        ) as executor:
+                            futures = [
+                                executor.submit(_render_and_mask_page, page_index, rects_by_page[page_index], self._grayscale)
+                                for page_index in pages_to_render
+                            ]
+                            for page_index, future in zip(pages_to_render, futures):
+                                add_page(page_index, *future.result())
+                    else:
+                        # Encode each page in a background thread while the next one renders
+                        # (PDFium calls stay on this thread, Pillow releases the GIL while encoding)
+                        with ThreadPoolExecutor(max_workers=1) as encoder:
+                            pending = None
+                            for page_index in pages_to_render:
+                                image, page_width, page_height = _render_page_with_masks(pdf, page_index, rects_by_page[page_index], self._grayscale)
+                                encoding = encoder.submit(_encode_page_image, image)
+                                if pending is not None:
+                                    add_page(pending[0], pending[1].result(), *pending[2:])
+                                pending = (page_index, encoding, page_width, page_height)
+                            if pending is not None:
+                                add_page(pending[0], pending[1].result(), *pending[2:])
                     
-                    # Add bbox offset to rectangle height for better coverage
-                    bbox_offset = abs(bbox_y0)  # Value absolute of bbox offset
-                    height_adjustment = bbox_offset * scale_y
-                    y0 -= height_adjustment  # Extend only above
+                    # Copy the untouched pages after the last rasterized one
+                    if copied_until < page_count:
+                        output_pdf.import_pages(pdf, list(range(copied_until, page_count)))
                     
-                    # Draw black rectangle at high resolution
-                    draw.rectangle([x0, y0, x1, y1], fill=(0, 0, 0))
-                
-                # Resize to optimal resolution for PDF output (2.5x scale)
-                target_scale = 2.5
-                target_width = int(page_width * target_scale)
-                target_height = int(page_height * target_scale)
+                    output_buffer = io.BytesIO()
+                    output_pdf.save(output_buffer)
+                    return output_buffer.getvalue()
+                finally:
+                    output_pdf.close()
                 
-                # Use high-quality resizing (LANCZOS for best quality)
-                resized_image = pil_image.resize((target_width, target_height), Image.Resampling.LANCZOS)
-                
-                # Convert resized image to PDF using ReportLab with optimized compression
-                img_buffer = io.BytesIO()
-                resized_image.save(img_buffer, format='JPEG', quality=95, optimize=True)
-                img_buffer.seek(0)
+        except Exception as e:
+            raise DocumentProcessingError(f"Failed to obfuscate with pypdfium2+PIL: {str(e)}")
+
+    def _obfuscate_with_vector_rectangles(self, document: Document, occurrences: List[TermOccurrence]) -> bytes:
+        """
+        Obfuscate by inserting opaque black rectangles into the page content streams.
+        No rendering is involved; only pages with occurrences are modified.
+        
+        Args:
+            document: Document to obfuscate
+            occurrences: List of occurrences to mask
+            
+        Returns:
+            bytes: PDF document with masked occurrences
+        """
+        try:
+            # The document is modified below, so it is opened privately from the bytes
+            # rather than taken from (or added to) the shared cache
+            pdf_content = document.data if document.data is not None else self._file_storage.read_file(document.path)
+            pdf = pdfium.PdfDocument(pdf_content)
+            try:
+                # Group occurrences by page
+                occ_by_page = {}
+                for occ in occurrences:
+                    occ_by_page.setdefault(occ.page_number - 1, []).append(occ)
                 
-                # Add image to PDF page
-                c.setPageSize((page_width, page_height))
-                c.drawImage(ImageReader(img_buffer), 0, 0, page_width, page_height)
+                for page_index, page_occurrences in occ_by_page.items():
+                    page = pdf[page_index]
+                    
+                    # One path object per page, with one closed subpath per occurrence
+                    path = pdfium_c.FPDFPageObj_CreateNewPath(0, 0)
+                    for occ in page_occurrences:
+                        # Positions are already in PDF user space (left, bottom, right, top)
+                        x0, x1 = sorted((occ.position.x0, occ.position.x1))
+                        y0, y1 = sorted((occ.position.y0, occ.position.y1))
+                        
+                        pdfium_c.FPDFPath_MoveTo(path, x0, y0)
+                        pdfium_c.FPDFPath_LineTo(path, x1, y0)
+                        pdfium_c.FPDFPath_LineTo(path, x1, y1)
+                        pdfium_c.FPDFPath_LineTo(path, x0, y1)
+                        pdfium_c.FPDFPath_Close(path)
+                    
+                    # Subpaths share one orientation, so overlapping rectangles stay filled
+                    pdfium_c.FPDFPageObj_SetFillColor(path, 0, 0, 0, 255)
+                    pdfium_c.FPDFPath_SetDrawMode(path, pdfium_c.FPDF_FILLMODE_WINDING, False)
+                    # The page takes ownership of the inserted object
+                    pdfium_c.FPDFPage_InsertObject(page.raw, path)
+                    
+                    page.gen_content()
+                    page.close()
                 
-                # Add page break if not the last page
-                if page_index < len(pdf) - 1:
-                    c.showPage()
-            
-            # Save the PDF
-            c.save()
-            pdf.close()
+                output_buffer = io.BytesIO()
+                pdf.save(output_buffer)
+            finally:
+                pdf.close()
             
             return output_buffer.getvalue()
             
         except Exception as e:
-            raise DocumentProcessingError(f"Failed to obfuscate with pypdfium2+PIL+ReportLab: {str(e)}")
+            raise DocumentProcessingError(f"Failed to obfuscate with pypdfium2 vector rectangles: {str(e)}")
 
+    @contextmanager
+    def _use_document(self, document: Document) -> Iterator[Tuple[bytes, pdfium.PdfDocument]]:
+        """
+        Read and open a document, reusing a recently opened instance when the
+        file (or the content supplied with the document) has not changed since.
+        
+        The document is used by one call at a time, and an instance evicted
+        from the cache is only closed once no call uses it any more.
+        
+        Args:
+            document: Document to open
+            
+        Yields:
+            Tuple[bytes, pdfium.PdfDocument]: Raw content and opened document
+        """
+        entry = self._open_document(document)
+        try:
+            with entry.lock:
+                yield entry.content, entry.pdf
+        finally:
+            self._release_document(entry)
+    
+    def _open_document(self, document: Document) -> _CachedDocument:
+        """
+        Get an opened document, counting the caller as one of its users.
+        
+        Args:
+            document: Document to open
+            
+        Returns:
+            _CachedDocument: Opened document, to be handed back with _release_document
+        """
+        if document.data is not None:
+            # Supplied content: identified by its hash, confirmed by comparison below
+            signature = ("data", hash(document.data))
+        else:
+            signature = self._file_storage.get_file_signature(document.path)
+            if signature is None:
+                pdf_content = self._file_storage.read_file(document.path)
+                entry = _CachedDocument(pdf_content, pdfium.PdfDocument(pdf_content), cached=False)
+                entry.users = 1
+                return entry
+        
+        cache_key = (document.path, signature)
+        with self._document_cache_lock:
+            cached = self._document_cache.get(cache_key)
+            if cached is not None and (document.data is None or cached.content == document.data):
+                self._document_cache.move_to_end(cache_key)
+                cached.users += 1
+                return cached
+        
+        pdf_content = document.data if document.data is not None else self._file_storage.read_file(document.path)
+        entry = _CachedDocument(pdf_content, pdfium.PdfDocument(pdf_content))
+        entry.users = 1
+        
+        evicted = []
+        with self._document_cache_lock:
+            replaced = self._document_cache.pop(cache_key, None)
+            if replaced is not None:
+                evicted.append(replaced)
+            self._document_cache[cache_key] = entry
+            while len(self._document_cache) > self._DOCUMENT_CACHE_SIZE:
+                evicted.append(self._document_cache.popitem(last=False)[1])
+            for evicted_entry in evicted:
+                evicted_entry.evicted = True
+            # Documents still in use are closed by their last user
+            to_close = [evicted_entry for evicted_entry in evicted if evicted_entry.users == 0]
+        
+        for evicted_entry in to_close:
+            evicted_entry.pdf.close()
+        
+        return entry
+    
+    def _release_document(self, entry: _CachedDocument) -> None:
+        """
+        Hand back a document obtained from _open_document, closing it if it
+        was evicted from the cache and this was its last user.
+        
+        Args:
+            entry: Document to release
+        """
+        with self._document_cache_lock:
+            entry.users -= 1
+            should_close = entry.evicted and entry.users == 0
+        if should_close:
+            entry.pdf.close()
+
+    def close(self) -> None:
+        """Close the cached documents instead of waiting for garbage collection."""
+        with self._document_cache_lock:
+            cached = list(self._document_cache.values())
+            self._document_cache.clear()
+            for entry in cached:
+                entry.evicted = True
+            # Documents still in use are closed by their last user
+            to_close = [entry for entry in cached if entry.users == 0]
+        for entry in to_close:
+            entry.pdf.close()
+    
     def get_engine_info(self) -> dict:
         try:
             import pypdfium2
             version = getattr(pypdfium2, "__version__", "unknown")
             return {
-                "name": "pypdfium2+PIL+ReportLab",
+                "name": "pypdfium2+PIL",
                 "version": version,
                 "license": "Apache 2.0",
-                "description": "pypdfium2 with PIL+ReportLab for robust raster-based obfuscation"
+                "description": "pypdfium2 with PIL for robust raster-based obfuscation"
             }
         except ImportError:
             return {
-                "name": "pypdfium2+PIL+ReportLab",
+                "name": "pypdfium2+PIL",
                 "version": "not installed",
                 "license": "Apache 2.0",
-                "description": "pypdfium2 with PIL+ReportLab for robust raster-based obfuscation"
+                "description": "pypdfium2 with PIL for robust raster-based obfuscation"
             } 
\ No newline at end of file
@@ -1,23 +1,97 @@
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
+    from botocore.config import Config
     from botocore.exceptions import ClientError, NoCredentialsError
 except ImportError:
     boto3 = None
 
-from typing import Optional
+import io
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, BinaryIO, Dict, Hashable, List, Optional, Tuple
 from src.ports.file_storage_port import FileStoragePort
 from src.domain.exceptions import FileStorageError
 
 
+# S3 clients shared by all adapters using the same region and credentials
+# (boto3 clients are thread-safe, and each one owns a connection pool)
+_shared_clients: Dict[Tuple[str, Optional[str], Optional[str], int], Any] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _get_shared_client(
+    region_name: str,
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    read_timeout: int = 60
+):
+    """
+    Get the S3 client for a region, credentials and read timeout, creating it on first use.
+    
+    Args:
+        region_name: AWS region
+        aws_access_key_id: AWS access key (None to use env/IAM configuration)
+        aws_secret_access_key: AWS secret key (None to use env/IAM configuration)
+        read_timeout: Seconds to wait for data on a connection before retrying the request
+        
+    Returns:
+        S3 client
+    """
+    key = (region_name, aws_access_key_id, aws_secret_access_key, read_timeout)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            session_kwargs = {"region_name": region_name}
+            if aws_access_key_id and aws_secret_access_key:
+                session_kwargs.update({
+                    "aws_access_key_id": aws_access_key_id,
+                    "aws_secret_access_key": aws_secret_access_key
+                })
+            # Enough pooled connections for the parallel (and hedged) ranged reads and
+            # multipart uploads of several adapters; a short connect timeout so
+            # unreachable endpoints are retried quickly
+            client = boto3.Session(**session_kwargs).client(
+                's3',
+                config=Config(
+                    max_pool_connections=64,
+                    tcp_keepalive=True,
+                    connect_timeout=1,
+                    read_timeout=read_timeout,
+                    retries={'max_attempts': 5, 'mode': 'adaptive'}
+                )
+            )
+            _shared_clients[key] = client
+        return client
+
+
 class S3StorageAdapter(FileStoragePort):
     """Adapter for Amazon S3 file storage."""
     
+    # Objects larger than one part are read with parallel ranged GETs
+    # and written with concurrent multipart uploads
+    _READ_PART_SIZE = 8 * 1024 * 1024
+    _MAX_READ_CONCURRENCY = 16
+    
+    # Maximum number of keys accepted by one DeleteObjects request
+    _DELETE_BATCH_SIZE = 1000
+    
+    # A GET with no response after this delay (seconds) is duplicated, the first answer wins
+    _HEDGE_DELAY = 0.2
+    
+    # Read timeout (seconds) of the client sending GETs, so stalled reads are retried quickly.
+    # Uploads and deletes use a client with the default timeout, as S3 may take longer to answer them
+    _GET_READ_TIMEOUT = 3
+    
     def __init__(
         self,
         bucket_name: str,
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
-        region_name: str = "us-east-1"
+        region_name: str = "us-east-1",
+        validate_bucket: bool = False,
+        s3_client: Optional[Any] = None
     ):
         """
         Initialize the S3 adapter.
@@ -27,26 +101,40 @@ class S3StorageAdapter(FileStoragePort):
             aws_access_key_id: AWS access key (optional if configured via env/IAM)
             aws_secret_access_key: AWS secret key (optional if configured via env/IAM)
             region_name: AWS region
+            validate_bucket: Check that the bucket exists when the adapter is created
+                (one extra request; otherwise a missing bucket surfaces on first use)
+            s3_client: S3 client to use for all requests instead of the shared ones
+                for the region and credentials
         """
         if boto3 is None:
             raise ImportError("boto3 is required for S3 storage. Install with: pip install boto3")
         
         self.bucket_name = bucket_name
         
-        # Initialize S3 client
-        session_kwargs = {"region_name": region_name}
-        if aws_access_key_id and aws_secret_access_key:
-            session_kwargs.update({
-                "aws_access_key_id": aws_access_key_id,
-                "aws_secret_access_key": aws_secret_access_key
-            })
-        
         try:
-            session = boto3.Session(**session_kwargs)
-            self.s3_client = session.client('s3')
+            # Initialize S3 client
+            if s3_client is not None:
+                self.s3_client = s3_client
+                self._get_client = s3_client
+            else:
+                if not (aws_access_key_id and aws_secret_access_key):
+                    aws_access_key_id = aws_secret_access_key = None
+                self.s3_client = _get_shared_client(region_name, aws_access_key_id, aws_secret_access_key)
+                self._get_client = _get_shared_client(
+                    region_name, aws_access_key_id, aws_secret_access_key,
+                    read_timeout=self._GET_READ_TIMEOUT
+                )
+            self._request_executor = ThreadPoolExecutor(max_workers=2 * self._MAX_READ_CONCURRENCY)
+            self._transfer_config = TransferConfig(
+                multipart_threshold=self._READ_PART_SIZE,
+                multipart_chunksize=self._READ_PART_SIZE,
+                max_concurrency=self._MAX_READ_CONCURRENCY,
+                use_threads=True
+            )
             
-            # Check that the bucket exists
-            self.s3_client.head_bucket(Bucket=bucket_name)
+            if validate_bucket:
+                # Check that the bucket exists
+                self.s3_client.head_bucket(Bucket=bucket_name)
             
         except NoCredentialsError:
             raise FileStorageError("AWS credentials not found")
@@ -60,6 +148,9 @@ class S3StorageAdapter(FileStoragePort):
     def read_file(self, file_path: str) -> bytes:
         """
         Read a file from S3.
+        The first part is fetched with a ranged GET, which also reveals the
+        object size; the remaining parts of large objects are then fetched
+        concurrently.
         
         Args:
             file_path: S3 key of the file
@@ -71,8 +162,65 @@ class S3StorageAdapter(FileStoragePort):
             FileStorageError: In case of read error
         """
         try:
-            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_path)
-            return response['Body'].read()
+            try:
+                first_part, total_size, etag = self._read_first_part(file_path)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'InvalidRange':
+                    raise
+                # Empty objects have no satisfiable range
+                response = self._get_object(Bucket=self.bucket_name, Key=file_path)
+                return response['Body'].read()
+            
+            if total_size <= len(first_part):
+                return first_part
+            
+            content = bytearray(total_size)
+            content[:len(first_part)] = first_part
+            ranges = [
+                (start, min(start + self._READ_PART_SIZE, total_size) - 1)
+                for start in range(len(first_part), total_size, self._READ_PART_SIZE)
+            ]
+            
+            def read_range(byte_range: Tuple[int, int]) -> Tuple[int, bytes]:
+                start, end = byte_range
+                request = {"Bucket": self.bucket_name, "Key": file_path, "Range": f"bytes={start}-{end}"}
+                if etag:
+                    # Guarantees all parts come from the same object version
+                    request["IfMatch"] = etag
+                response = self._get_object(**request)
+                return start, response['Body'].read()
+            
+            with ThreadPoolExecutor(max_workers=min(self._MAX_READ_CONCURRENCY, len(ranges))) as executor:
+                for start, data in executor.map(read_range, ranges):
+                    content[start:start + len(data)] = data
+            
+            return bytes(content)
+            
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == 'NoSuchKey':
+                raise FileStorageError(f"File {file_path} not found in S3")
+            else:
+                raise FileStorageError(f"Error reading file from S3: {str(e)}")
+        except Exception as e:
+            raise FileStorageError(f"Unexpected error reading file from S3: {str(e)}")
+    
+    def open_file(self, file_path: str) -> BinaryIO:
+        """
+        Open a file from S3 for streamed reading.
+        
+        Args:
+            file_path: S3 key of the file
+            
+        Returns:
+            BinaryIO: Response body stream, to be closed by the caller
+            
+        Raises:
+            FileStorageError: In case of read error
+        """
+        try:
+            response = self._get_object(Bucket=self.bucket_name, Key=file_path)
+            return response['Body']
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -83,9 +231,101 @@ class S3StorageAdapter(FileStoragePort):
         except Exception as e:
             raise FileStorageError(f"Unexpected error reading file from S3: {str(e)}")
     
+    def read_file_range(self, file_path: str, offset: int, length: int) -> bytes:
+        """
+        Read part of a file from S3 with a single ranged GET.
+        
+        Args:
+            file_path: S3 key of the file
+            offset: Position of the first byte; negative values count from the end of the file
+            length: Maximum number of bytes to read
+            
+        Returns:
+            bytes: Up to length bytes starting at offset
+            
+        Raises:
+            FileStorageError: In case of read error
+        """
+        if length <= 0:
+            return b""
+        # "bytes=-N" requests the last N bytes of the object
+        byte_range = f"bytes={offset}" if offset < 0 else f"bytes={offset}-{offset + length - 1}"
+        try:
+            response = self._get_object(Bucket=self.bucket_name, Key=file_path, Range=byte_range)
+            return response['Body'].read()[:length]
+            
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == 'InvalidRange':
+                # Empty object, or offset past its end
+                return b""
+            if error_code == 'NoSuchKey':
+                raise FileStorageError(f"File {file_path} not found in S3")
+            raise FileStorageError(f"Error reading file from S3: {str(e)}")
+        except Exception as e:
+            raise FileStorageError(f"Unexpected error reading file from S3: {str(e)}")
+    
+    def _get_object(self, **request) -> dict:
+        """
+        Send a GetObject request, hedged against slow responses.
+        If no response arrives within _HEDGE_DELAY, an identical request is
+        sent (likely over another connection) and the first success is used.
+        
+        Args:
+            **request: GetObject parameters
+            
+        Returns:
+            dict: GetObject response
+        """
+        primary = self._request_executor.submit(self._get_client.get_object, **request)
+        try:
+            return primary.result(timeout=self._HEDGE_DELAY)
+        except FutureTimeoutError:
+            pass
+        
+        pending = {primary, self._request_executor.submit(self._get_client.get_object, **request)}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [future for future in done if future.exception() is None]
+            if succeeded:
+                # Release the connections held by the responses that are not used
+                for future in succeeded[1:]:
+                    _close_response_body(future)
+                for future in pending:
+                    future.add_done_callback(_close_response_body)
+                return succeeded[0].result()
+            error = next(iter(done)).exception()
+        raise error
+    
+    def _read_first_part(self, file_path: str) -> Tuple[bytes, int, str]:
+        """
+        Read the first part of an object.
+        
+        Args:
+            file_path: S3 key of the file
+            
+        Returns:
+            Tuple[bytes, int, str]: First part content, total object size and ETag
+        """
+        response = self._get_object(
+            Bucket=self.bucket_name,
+            Key=file_path,
+            Range=f"bytes=0-{self._READ_PART_SIZE - 1}"
+        )
+        data = response['Body'].read()
+        
+        # Content-Range is "bytes start-end/total"
+        content_range = response.get('ContentRange')
+        total_size = int(content_range.rsplit('/', 1)[1]) if content_range else len(data)
+        
+        return data, total_size, response.get('ETag')
+    
     def write_file(self, file_path: str, content: bytes) -> None:
         """
         Write a file to S3.
+        Large files are uploaded as concurrent multipart uploads, each part
+        being retried on its own.
         
         Args:
             file_path: S3 destination key
@@ -95,10 +335,11 @@ class S3StorageAdapter(FileStoragePort):
             FileStorageError: In case of write error
         """
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=file_path,
-                Body=content
+            self.s3_client.upload_fileobj(
+                io.BytesIO(content),
+                self.bucket_name,
+                file_path,
+                Config=self._transfer_config
             )
             
         except ClientError as e:
@@ -124,6 +365,22 @@ class S3StorageAdapter(FileStoragePort):
         except Exception:
             return False
     
+    def get_file_signature(self, file_path: str) -> Optional[Hashable]:
+        """
+        Get the ETag and size of a file in S3.
+        
+        Args:
+            file_path: S3 key of the file
+            
+        Returns:
+            Optional[Hashable]: (ETag, size) tuple, or None if the object cannot be inspected
+        """
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=file_path)
+            return (response.get('ETag'), response.get('ContentLength'))
+        except ClientError:
+            return None
+    
     def delete_file(self, file_path: str) -> None:
         """
         Delete a file from S3.
@@ -140,4 +397,44 @@ class S3StorageAdapter(FileStoragePort):
         except ClientError as e:
             raise FileStorageError(f"Error deleting file from S3: {str(e)}")
         except Exception as e:
-            raise FileStorageError(f"Unexpected error deleting file from S3: {str(e)}") 
\ No newline at end of file
+            raise FileStorageError(f"Unexpected error deleting file from S3: {str(e)}") 
+
+    
+    def delete_files(self, file_paths: List[str]) -> None:
+        """
+        Delete several files from S3, up to 1000 per request.
+        
+        Args:
+            file_paths: S3 keys of the files to delete
+            
+        Raises:
+            FileStorageError: In case of deletion error (after all batches were sent)
+        """
+        failed_keys = []
+        try:
+            for start in range(0, len(file_paths), self._DELETE_BATCH_SIZE):
+                batch = file_paths[start:start + self._DELETE_BATCH_SIZE]
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': file_path} for file_path in batch], 'Quiet': True}
+                )
+                # Quiet mode only reports the keys that could not be deleted
+                failed_keys.extend(error['Key'] for error in response.get('Errors', []))
+                
+        except ClientError as e:
+            raise FileStorageError(f"Error deleting files from S3: {str(e)}")
+        except Exception as e:
+            raise FileStorageError(f"Unexpected error deleting files from S3: {str(e)}")
+        
+        if failed_keys:
+            raise FileStorageError(f"Error deleting files from S3: {', '.join(failed_keys)}")
+    
+    def close(self) -> None:
+        """Shut down the threads sending the hedged GET requests."""
+        self._request_executor.shutdown(wait=False)
+
+
+def _close_response_body(future: Future) -> None:
+    """Close the body stream of a GetObject response that is not used."""
+    if not future.cancelled() and future.exception() is None:
+        future.result()['Body'].close()
@@ -2,71 +2,274 @@
 Tesseract text extractor adapter.
 Uses Tesseract OCR for text extraction.
 """
-import re
+import hashlib
+import io
+import logging
+import os
+import tempfile
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import replace
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-from pdf2image import convert_from_bytes
+from pdf2image import convert_from_path
 import pytesseract
 
+try:
+    from PyPDF2 import PdfReader
+except ImportError:
+    PdfReader = None
+
+from .disk_cache import DiskCache
 from ..ports.text_extractor_port import TextExtractorPort
 from ..domain.entities import Document, TextExtractionResult
 from ..domain.exceptions import DocumentProcessingError
 
 
+logger = logging.getLogger(__name__)
+
+
 class TesseractTextExtractor(TextExtractorPort):
     """
     Text extractor using Tesseract OCR.
     Uses pdf2image + Tesseract for text extraction.
     """
     
-    def __init__(self, file_storage):
+    # Read size used when streaming a document to disk or hashing it
+    _SPOOL_CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(
+        self,
+        file_storage,
+        max_workers: Optional[int] = None,
+        dpi: int = 300,
+        grayscale: bool = True,
+        tesseract_config: str = "--oem 1 --psm 6",
+        cache_dir: Optional[str] = None,
+        use_text_layer: bool = False,
+        min_text_layer_chars: int = 50
+    ):
         """
         Initialize the extractor.
         
         Args:
             file_storage: File storage port for reading documents
+            max_workers: Number of pages converted and OCR'd concurrently (default: CPU count)
+            dpi: Resolution pages are rasterized at for OCR
+            grayscale: Rasterize pages as greyscale, which Tesseract processes faster
+            tesseract_config: Extra Tesseract options (default: LSTM engine, single text block)
+            cache_dir: Directory where results are cached by document content (no caching if omitted)
+            use_text_layer: Take the text of pages that have a text layer from it and only OCR
+                the others. Off by default: OCR reports what is visible, while the text layer
+                may contain text that is hidden on the page
+            min_text_layer_chars: Non-whitespace characters a page's text layer needs to be used
         """
+        if use_text_layer and PdfReader is None:
+            raise ImportError("PyPDF2 is required to read text layers. Install with: pip install PyPDF2")
+        
         self._file_storage = file_storage
-        self._pdf2image = convert_from_bytes
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._dpi = dpi
+        self._grayscale = grayscale
+        self._tesseract_config = tesseract_config
+        self._use_text_layer = use_text_layer
+        self._min_text_layer_chars = min_text_layer_chars
+        self._cache = DiskCache(cache_dir) if cache_dir else None
+        self._tesseract_version: Optional[str] = None
+        self._pdf2image = convert_from_path
         self._pytesseract = pytesseract
     
     def extract_text(self, document: Document) -> TextExtractionResult:
         """Extract text from PDF using Tesseract OCR."""
         start_time = time.time()
         try:
-            pdf_content = self._file_storage.read_file(document.path)
-            
-            # Convert PDF to images
-            images = self._pdf2image(pdf_content, dpi=400)
+            with tempfile.TemporaryDirectory() as temp_dir:
+                # Work from a file on disk: pdf2image and PyPDF2 read it from there,
+                # so the document never has to be held in memory
+                pdf_path, content_digest = self._spool_document(document, temp_dir)
+                
+                # Reuse the result of a previous OCR of the same content and settings
+                cache_key = None
+                if content_digest is not None:
+                    cache_key = self._get_cache_key(content_digest)
+                    cached_result = self._cache.get(cache_key)
+                    if cached_result is not None:
+                        return replace(cached_result, execution_time=time.time() - start_time)
+                
+                if self._use_text_layer:
+                    # Only pages without a usable text layer (scans) are OCR'd, one by one
+                    pages = self._read_text_layer(pdf_path)
+                    missing_pages = [index for index, page_text in enumerate(pages) if page_text is None]
+                    if missing_pages:
+                        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                            ocr_texts = executor.map(
+                                lambda index: self._ocr_pdf_page(pdf_path, index + 1, temp_dir),
+                                missing_pages
+                            )
+                            for index, page_text in zip(missing_pages, ocr_texts):
+                                pages[index] = page_text
+                else:
+                    # Convert PDF to page images on disk, loaded one at a time for OCR
+                    image_paths = self._pdf2image(
+                        pdf_path,
+                        dpi=self._dpi,
+                        fmt='png',
+                        grayscale=self._grayscale,
+                        thread_count=self._max_workers,
+                        output_folder=temp_dir,
+                        paths_only=True
+                    )
+                    
+                    # Extract text from all pages using Tesseract. Each call runs a separate
+                    # tesseract process, so threads are enough to OCR pages in parallel
+                    with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                        pages = list(executor.map(self._ocr_page, image_paths))
             
-            # Extract text from all pages using Tesseract
-            pages = []
-            full_text = ""
-            
-            for image in images:
-                page_text = self._pytesseract.image_to_string(image)
-                pages.append(page_text)
-                full_text += page_text + " "
-            
-            # Clean up text
-            full_text = re.sub(r'\s+', ' ', full_text).strip()
-            word_count = len(full_text.split())
+            # Clean up text: a single split both collapses whitespace and counts words
+            words = " ".join(pages).split()
+            full_text = " ".join(words)
+            word_count = len(words)
             
             execution_time = time.time() - start_time
             
-            return TextExtractionResult(
+            result = TextExtractionResult(
                 text=full_text,
                 page_count=len(pages),
                 word_count=word_count,
                 pages=pages,
                 execution_time=execution_time
             )
+            if cache_key is not None:
+                # The cache is best-effort: a failed write must not lose the OCR result
+                try:
+                    self._cache.put(cache_key, result)
+                except OSError as e:
+                    logger.debug("Could not cache OCR result of %s: %s", document.path, e)
+            
+            return result
             
         except Exception as e:
             execution_time = time.time() - start_time
             raise DocumentProcessingError(f"Error extracting text with Tesseract OCR: {str(e)}")
     
+    def _spool_document(self, document: Document, temp_dir: str) -> Tuple[str, Optional[bytes]]:
+        """
+        Get a local path to a document, streaming it to disk if it is not a local file.
+        
+        Args:
+            document: Document to read (from its content if supplied, else from the file storage)
+            temp_dir: Directory for the local copy
+            
+        Returns:
+            Tuple[str, Optional[bytes]]: Local path of the document, and the SHA-256
+            digest of its content when results are cached (None otherwise)
+        """
+        digest = hashlib.sha256() if self._cache is not None else None
+        
+        if document.data is not None:
+            source_file = io.BytesIO(document.data)
+        else:
+            source_file = self._file_storage.open_file(document.path)
+        
+        with closing(source_file) as source:
+            local_path = getattr(source, "name", None)
+            if isinstance(local_path, str) and os.path.isfile(local_path):
+                # Local file: use it in place, only read it through to hash it
+                if digest is not None:
+                    for chunk in iter(lambda: source.read(self._SPOOL_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+            else:
+                local_path = os.path.join(temp_dir, "document.pdf")
+                with open(local_path, "wb") as target:
+                    for chunk in iter(lambda: source.read(self._SPOOL_CHUNK_SIZE), b""):
+                        if digest is not None:
+                            digest.update(chunk)
+                        target.write(chunk)
+        
+        return local_path, (digest.digest() if digest is not None else None)
+    
+    def _get_cache_key(self, content_digest: bytes) -> str:
+        """
+        Build the cache key of a document for the current OCR settings.
+        
+        Args:
+            content_digest: SHA-256 digest of the document content
+            
+        Returns:
+            str: Cache key, which changes with the content, the settings or the Tesseract version
+        """
+        if self._tesseract_version is None:
+            self._tesseract_version = str(self._pytesseract.get_tesseract_version())
+        return DiskCache.make_key(
+            content_digest, self._dpi, self._grayscale, self._tesseract_config, self._tesseract_version,
+            self._use_text_layer, self._min_text_layer_chars
+        )
+    
+    def _read_text_layer(self, pdf_path: str) -> List[Optional[str]]:
+        """
+        Read the text layer of each page.
+        
+        Args:
+            pdf_path: Local path of the document
+            
+        Returns:
+            List[Optional[str]]: Text of each page, or None for pages whose text layer
+            is missing, too short or unreadable and must be OCR'd
+        """
+        page_texts = []
+        for page in PdfReader(pdf_path).pages:
+            try:
+                page_text = page.extract_text() or ""
+            except Exception:
+                # Unreadable text layer: fall back to OCR for this page
+                page_text = ""
+            if len("".join(page_text.split())) >= self._min_text_layer_chars:
+                page_texts.append(page_text)
+            else:
+                page_texts.append(None)
+        return page_texts
+    
+    def _ocr_pdf_page(self, pdf_path: str, page_number: int, output_folder: str) -> str:
+        """
+        Rasterize and OCR a single page of a document.
+        
+        Args:
+            pdf_path: Local path of the document
+            page_number: 1-based number of the page
+            output_folder: Directory for the temporary page image
+            
+        Returns:
+            str: Text recognized on the page
+        """
+        image_paths = self._pdf2image(
+            pdf_path,
+            dpi=self._dpi,
+            fmt='png',
+            grayscale=self._grayscale,
+            first_page=page_number,
+            last_page=page_number,
+            output_folder=output_folder,
+            paths_only=True
+        )
+        return self._ocr_page(image_paths[0])
+    
+    def _ocr_page(self, image_path: str) -> str:
+        """
+        OCR one page image, then delete it so only pages being processed stay around.
+        The path is handed to Tesseract as-is, so the image is never decoded in Python.
+        
+        Args:
+            image_path: Path of the page image
+            
+        Returns:
+            str: Text recognized on the page
+        """
+        try:
+            return self._pytesseract.image_to_string(image_path, config=self._tesseract_config)
+        finally:
+            os.remove(image_path)
+    
     def get_extractor_info(self) -> Dict[str, Any]:
         """Get information about this text extractor."""
         return {
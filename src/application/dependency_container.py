@@ -2,7 +2,8 @@
 Dependency container for PDF obfuscation application.
 Centralizes the creation of all dependencies to maintain clean architecture.
 """
-from typing import Optional
+import threading
+from typing import Dict, Optional
 from ..ports.pdf_processor_port import PdfProcessorPort
 from ..ports.file_storage_port import FileStoragePort
 from ..ports.quality_evaluator_port import QualityEvaluatorPort
@@ -11,6 +12,8 @@ from ..domain.services.configuration_service import ConfigurationService
 from ..domain.services.document_obfuscation_service import DocumentObfuscationService
 from ..domain.services.quality_evaluation_service import QualityEvaluationService
 from ..domain.services.error_handler import ErrorHandler
+from ..adapters.local_storage_adapter import LocalStorageAdapter
+from .pdf_processor_factory import PdfProcessorFactory
 
 
 class DependencyContainer:
@@ -20,60 +23,61 @@ class DependencyContainer:
         """Initialize the dependency container."""
         self._configuration_service = ConfigurationService()
         self._file_storage: Optional[FileStoragePort] = None
-        self._pdf_processor: Optional[PdfProcessorPort] = None
-        self._quality_evaluator: Optional[QualityEvaluatorPort] = None
-        self._text_extractor: Optional[TextExtractorPort] = None
+        # One instance per engine / extractor type, so alternating between them reuses instances
+        self._pdf_processors: Dict[str, PdfProcessorPort] = {}
+        self._pdf_processors_lock = threading.Lock()
+        self._pdf_processor_factory = PdfProcessorFactory()
+        self._quality_evaluators: Dict[str, QualityEvaluatorPort] = {}
+        self._text_extractors: Dict[str, TextExtractorPort] = {}
         self._obfuscation_service: Optional[DocumentObfuscationService] = None
         self._error_handler: Optional[ErrorHandler] = None
+        self._application = None
     
     def get_file_storage(self) -> FileStoragePort:
         """Get or create file storage adapter."""
         if self._file_storage is None:
-            from ..adapters.local_storage_adapter import LocalStorageAdapter
             self._file_storage = LocalStorageAdapter()
         return self._file_storage
     
     def get_pdf_processor(self, engine: str = "pymupdf") -> PdfProcessorPort:
         """Get or create PDF processor for the specified engine."""
-        if self._pdf_processor is None or engine != getattr(self._pdf_processor, '_current_engine', None):
-            from .pdf_processor_factory import PdfProcessorFactory
-            
-            # Import processor classes (dependency injection)
-            from ..adapters.pymupdf_adapter import PyMuPdfAdapter
-            from ..adapters.pypdfium2_adapter import PyPdfium2Adapter
-            from ..adapters.pdfplumber_adapter import PdfPlumberAdapter
-            
-            processor_classes = {
-                "pymupdf": PyMuPdfAdapter,
-                "pypdfium2": PyPdfium2Adapter,
-                "pdfplumber": PdfPlumberAdapter
-            }
-            
-            factory = PdfProcessorFactory(processor_classes)
-            self._pdf_processor = factory.create_processor(engine, self.get_file_storage())
-            # Store current engine for future reference
-            setattr(self._pdf_processor, '_current_engine', engine)
-        return self._pdf_processor
+        processor = self._pdf_processors.get(engine)
+        if processor is not None:
+            return processor
+        
+        # Threads sharing the container build each engine's processor only once
+        with self._pdf_processors_lock:
+            if engine not in self._pdf_processors:
+                # Engine libraries are only loaded on first use; later calls return the cached instance
+                self._pdf_processors[engine] = self._pdf_processor_factory.create_processor(engine, self.get_file_storage())
+            return self._pdf_processors[engine]
+    
+    def get_pdf_processor_factory(self) -> PdfProcessorFactory:
+        """Get the factory creating the PDF processors, e.g. to register an engine."""
+        return self._pdf_processor_factory
     
     def get_text_extractor(self, extractor_type: str = "tesseract") -> TextExtractorPort:
         """Get or create text extractor of the specified type."""
-        if self._text_extractor is None or extractor_type != getattr(self._text_extractor, '_current_type', None):
+        if extractor_type not in self._text_extractors:
             if extractor_type == "mistral":
                 from ..adapters.mistral_text_extractor import MistralTextExtractor
-                self._text_extractor = MistralTextExtractor(self.get_file_storage())
+                text_extractor = MistralTextExtractor(self.get_file_storage())
             else:  # default to tesseract
                 from ..adapters.tesseract_text_extractor import TesseractTextExtractor
-                self._text_extractor = TesseractTextExtractor(self.get_file_storage())
-            setattr(self._text_extractor, '_current_type', extractor_type)
-        return self._text_extractor
+                text_extractor = TesseractTextExtractor(
+                    self.get_file_storage(),
+                    cache_dir=self._configuration_service.get_ocr_cache_directory(),
+                    use_text_layer=self._configuration_service.get_ocr_use_text_layer()
+                )
+            self._text_extractors[extractor_type] = text_extractor
+        return self._text_extractors[extractor_type]
     
     def get_quality_evaluator(self, extractor_type: str = "tesseract") -> QualityEvaluatorPort:
         """Get or create quality evaluator with the specified text extractor."""
-        if self._quality_evaluator is None or extractor_type != getattr(self._quality_evaluator, '_current_extractor_type', None):
+        if extractor_type not in self._quality_evaluators:
             text_extractor = self.get_text_extractor(extractor_type)
-            self._quality_evaluator = QualityEvaluationService(text_extractor)
-            setattr(self._quality_evaluator, '_current_extractor_type', extractor_type)
-        return self._quality_evaluator
+            self._quality_evaluators[extractor_type] = QualityEvaluationService(text_extractor, self.get_file_storage())
+        return self._quality_evaluators[extractor_type]
     
     def get_obfuscation_service(self) -> DocumentObfuscationService:
         """Get or create document obfuscation service."""
@@ -92,12 +96,22 @@ class DependencyContainer:
         """Get configuration service."""
         return self._configuration_service
     
+    def close(self) -> None:
+        """Release the native resources held by the cached PDF processors."""
+        with self._pdf_processors_lock:
+            processors = list(self._pdf_processors.values())
+        for processor in processors:
+            processor.close()
+    
     def reset(self):
         """Reset all dependencies (useful for testing)."""
+        self.close()
+        if self._file_storage is not None:
+            self._file_storage.close()
         self._file_storage = None
-        self._pdf_processor = None
-        self._quality_evaluator = None
-        self._text_extractor = None
+        self._pdf_processors = {}
+        self._quality_evaluators = {}
+        self._text_extractors = {}
         self._obfuscation_service = None
         self._error_handler = None
         self._application = None
@@ -2,9 +2,16 @@
 Application service for PDF obfuscation.
 Coordinates domain services, use cases, and infrastructure adapters.
 """
-from typing import List, Optional
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Callable, Iterator, List, Optional, Tuple
 
-from src.domain.entities import ObfuscationRequest, ObfuscationResult, Document, Term, QualityReport
+from src.domain.entities import ObfuscationRequest, ObfuscationResult, Document, Term, QualityReport, BatchResult
 from src.domain.services.document_obfuscation_service import DocumentObfuscationService
 from src.domain.exceptions import ObfuscationError, DocumentProcessingError, FileStorageError
 from src.domain.services.error_handler import ErrorContext
@@ -14,6 +21,41 @@ from src.ports.file_storage_port import FileStoragePort
 from src.ports.quality_evaluator_port import QualityEvaluatorPort
 from .dependency_container import DependencyContainer
 
+logger = logging.getLogger(__name__)
+
+# Application built once per batch worker process by _init_batch_worker
+_worker_application = None
+
+
+def _init_batch_worker(engine: str, container_factory: Callable[[], DependencyContainer]) -> None:
+    """Create the application used by a batch worker process, with the engine's processor ready."""
+    global _worker_application
+    _worker_application = PdfObfuscationApplication(container_factory(), container_factory=container_factory)
+    container = _worker_application._dependency_container
+    if container.get_configuration_service().validate_engine(engine):
+        container.get_pdf_processor(engine)
+
+
+def _init_quality_worker(evaluator_type: str, container_factory: Callable[[], DependencyContainer]) -> None:
+    """Create the application used by a quality evaluation worker process, with its evaluator ready."""
+    global _worker_application
+    _worker_application = PdfObfuscationApplication(container_factory(), container_factory=container_factory)
+    _worker_application._dependency_container.get_quality_evaluator(evaluator_type)
+
+
+def _evaluate_in_worker(pair: Tuple[str, str, List[str], str], evaluator_type: str) -> QualityReport:
+    """Worker entry point: evaluate one (original, obfuscated) pair of a batch."""
+    original_document_path, obfuscated_document_path, terms_to_obfuscate, engine_used = pair
+    return _worker_application.evaluate_quality(
+        original_document_path, obfuscated_document_path, terms_to_obfuscate, engine_used, evaluator_type
+    )
+
+
+def _obfuscate_in_worker(job: Tuple[str, List[str], Optional[str]], engine: str) -> ObfuscationResult:
+    """Worker entry point: obfuscate one document of a batch."""
+    source_path, terms, destination_path = job
+    return _worker_application.obfuscate_document(source_path, terms, destination_path, engine)
+
 
 class PdfObfuscationApplication:
     """Main application service for PDF obfuscation."""
@@ -21,18 +63,36 @@ class PdfObfuscationApplication:
     def __init__(
         self,
         dependency_container: Optional[DependencyContainer] = None,
-        default_engine: str = "pymupdf"
+        default_engine: str = "pymupdf",
+        container_factory: Optional[Callable[[], DependencyContainer]] = None
     ):
         """
         Initialize the application with its dependencies.
         
         Args:
-            dependency_container: Container managing all dependencies (default: new instance)
+            dependency_container: Container managing all dependencies
+                (default: created with container_factory)
             default_engine: Default engine to use (pymupdf)
+            container_factory: Picklable callable creating a container configured
+                like dependency_container, used by batch worker processes
+                (default: DependencyContainer when no container is given)
         """
-        self._dependency_container = dependency_container or DependencyContainer()
+        if container_factory is None and dependency_container is None:
+            container_factory = DependencyContainer
+        self._container_factory = container_factory
+        self._dependency_container = dependency_container or container_factory()
         self._default_engine = default_engine
         
+        # Services used on every call, resolved once
+        self._config_service = self._dependency_container.get_configuration_service()
+        self._file_storage = self._dependency_container.get_file_storage()
+        self._obfuscation_service = self._dependency_container.get_obfuscation_service()
+        self._error_handler = self._dependency_container.get_error_handler()
+        
+        # The container's processors are shared and not thread-safe (PDFium in
+        # particular), so the async variants run one call at a time
+        self._async_lock = threading.Lock()
+        
         # Use cases supprimés - logique intégrée directement dans les méthodes
     
 
@@ -43,7 +103,8 @@ class PdfObfuscationApplication:
         terms: List[str],
         destination_path: Optional[str] = None,
         engine: str = "pymupdf",
-        evaluate_quality: bool = False
+        evaluate_quality: bool = False,
+        source_data: Optional[bytes] = None
     ) -> ObfuscationResult:
         """
         Obfuscate a PDF document with the specified terms.
@@ -54,35 +115,41 @@ class PdfObfuscationApplication:
             destination_path: Destination path (optional)
             engine: Obfuscation engine to use
             evaluate_quality: Whether to evaluate quality after obfuscation
+                (the evaluation reads the source document from source_path)
+            source_data: Content of the source document if the caller already
+                loaded it; it is then not read from storage
             
         Returns:
             ObfuscationResult: Obfuscation result
         """
+        # Known once the source path is validated; reused on the error path
+        dest_path = destination_path
         try:
             # Input validation using configuration service
-            config_service = self._dependency_container.get_configuration_service()
             if not source_path or not source_path.strip():
                 raise ObfuscationError("Source document path cannot be empty")
+            dest_path = destination_path or self._config_service.get_default_output_path(source_path)
             
-            if not terms:
+            # Duplicate terms would be searched and redacted several times
+            unique_terms = self._obfuscation_service.normalize_terms(terms)
+            if not unique_terms:
                 raise ObfuscationError("At least one term must be specified")
             
-            if not config_service.validate_engine(engine):
-                supported = ", ".join(config_service.get_supported_engines())
+            if not self._config_service.validate_engine(engine):
+                supported = ", ".join(self._config_service.get_supported_engines())
                 raise ObfuscationError(f"Engine {engine} not supported. Available engines: {supported}")
             
+            # Cheap checks first: remote storages pay a round-trip for the existence check
+            if not source_path.lower().endswith('.pdf'):
+                raise ObfuscationError(f"Source file {source_path} is not a PDF")
+            
             # Check that source file exists
-            file_storage = self._dependency_container.get_file_storage()
-            if not file_storage.file_exists(source_path):
+            if source_data is None and not self._file_storage.file_exists(source_path):
                 raise ObfuscationError(f"Source file {source_path} does not exist")
             
             # Create obfuscation request
-            source_document = Document(path=source_path)
-            if destination_path:
-                dest_path = destination_path
-            else:
-                dest_path = config_service.get_default_output_path(source_path)
-            term_objects = [Term(text=term.strip()) for term in terms if term.strip()]
+            source_document = Document(path=source_path, data=source_data)
+            term_objects = [Term(text=term) for term in unique_terms]
             
             request = ObfuscationRequest(
                 source_document=source_document,
@@ -92,28 +159,33 @@ class PdfObfuscationApplication:
             )
             
             # Validate request according to business rules
-            obfuscation_service = self._dependency_container.get_obfuscation_service()
-            obfuscation_service.validate_obfuscation_request(request)
+            self._obfuscation_service.validate_obfuscation_request(request)
             
             # Get processor for the specified engine
             processor = self._dependency_container.get_pdf_processor(engine)
             
             # Execute obfuscation directly (use case logic integrated)
-            result = self._execute_obfuscation(processor, file_storage, obfuscation_service, source_path, [term.text for term in term_objects], dest_path)
+            result = self._execute_obfuscation(processor, engine, self._file_storage, self._obfuscation_service, source_document, term_objects, dest_path)
             
             # Evaluate quality if requested
             if evaluate_quality and result.success:
-                quality_report = self.evaluate_quality(source_path, dest_path, terms, engine)
-                # Add quality report to the result (you might want to extend ObfuscationResult for this)
-                print(f"Quality evaluation completed. Overall score: {quality_report.metrics.overall_score}")
+                # Both files were just read and written, no need to check they exist again
+                quality_report = self._execute_quality_evaluation(
+                    quality_evaluator=self._dependency_container.get_quality_evaluator(),
+                    file_storage=self._file_storage,
+                    original_document_path=source_path,
+                    obfuscated_document_path=dest_path,
+                    terms_to_obfuscate=unique_terms,
+                    engine_used=engine,
+                    check_files=False
+                )
+                result = replace(result, quality_report=quality_report)
+                logger.debug("Quality evaluation completed. Overall score: %s", quality_report.metrics.overall_score)
             
             return result
             
         except Exception as e:
             # Use centralized error handler
-            # Ensure dest_path is defined for error context
-            config_service = self._dependency_container.get_configuration_service()
-            dest_path = destination_path or config_service.get_default_output_path(source_path)
             context = ErrorContext(
                 operation="obfuscate_document",
                 source_path=source_path,
@@ -121,7 +193,152 @@ class PdfObfuscationApplication:
                 terms=terms,
                 engine=engine
             )
-            return self._dependency_container.get_error_handler().handle_obfuscation_error(e, context, engine)
+            return self._error_handler.handle_obfuscation_error(e, context, engine)
+    
+    async def obfuscate_document_async(self, *args, **kwargs) -> ObfuscationResult:
+        """
+        Asynchronous variant of obfuscate_document, for event-loop based servers.
+        
+        The obfuscation runs in a worker thread, so the event loop is not blocked.
+        Calls are serialized: the container's PDF processors are shared and not
+        thread-safe, so overlapping awaits wait for each other rather than run
+        concurrently. Use batch_obfuscate to process several documents in parallel.
+        
+        Args:
+            *args: Positional arguments of obfuscate_document
+            **kwargs: Keyword arguments of obfuscate_document
+            
+        Returns:
+            ObfuscationResult: Obfuscation result
+        """
+        return await asyncio.to_thread(self._run_serialized, self.obfuscate_document, *args, **kwargs)
+    
+    def batch_obfuscate(
+        self,
+        jobs: List[Tuple[str, List[str], Optional[str]]],
+        engine: str = "pymupdf",
+        max_workers: Optional[int] = None,
+        continue_on_error: bool = True,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> BatchResult:
+        """
+        Obfuscate several documents in parallel worker processes and summarize the outcome.
+        
+        Each worker process builds its own application (with a container from
+        the application's container_factory) and processes whole documents,
+        so no PDF library state crosses process boundaries. A job that fails,
+        even by crashing its worker, gets a failed result instead of aborting
+        the batch. Progress is reported as documents complete.
+        
+        Args:
+            jobs: (source path, terms, destination path or None) for each document
+            engine: Obfuscation engine to use
+            max_workers: Number of worker processes (default: CPU count)
+            continue_on_error: If False, documents not yet started are skipped
+                after the first failed document
+            progress_callback: Called with (completed documents, total documents)
+                after each document
+            
+        Returns:
+            BatchResult: Successful and failed documents, with their source paths
+            
+        Raises:
+            ObfuscationError: If several workers are used and the application
+                has no container_factory
+        """
+        start_time = time.time()
+        successful = []
+        failed = []
+        
+        for index, result in self._run_obfuscation_jobs(jobs, engine, max_workers):
+            source_path = jobs[index][0]
+            if result.success:
+                successful.append((source_path, result))
+            else:
+                failed.append((source_path, result))
+            
+            if progress_callback is not None:
+                progress_callback(len(successful) + len(failed), len(jobs))
+            if not result.success and not continue_on_error:
+                break
+        
+        return BatchResult(
+            successful=successful,
+            failed=failed,
+            total_processed=len(successful) + len(failed),
+            processing_time=time.time() - start_time
+        )
+    
+    def _run_obfuscation_jobs(
+        self,
+        jobs: List[Tuple[str, List[str], Optional[str]]],
+        engine: str,
+        max_workers: Optional[int]
+    ) -> Iterator[Tuple[int, ObfuscationResult]]:
+        """
+        Obfuscate documents in worker processes, yielding results as they complete.
+        Jobs not yet started are cancelled if the caller stops iterating.
+        
+        Args:
+            jobs: (source path, terms, destination path or None) for each document
+            engine: Obfuscation engine to use
+            max_workers: Number of worker processes (default: CPU count)
+            
+        Yields:
+            Tuple[int, ObfuscationResult]: Index of the job and its result
+        """
+        if not jobs:
+            return
+        
+        max_workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        if max_workers == 1:
+            for index, (source_path, terms, destination_path) in enumerate(jobs):
+                yield index, self.obfuscate_document(source_path, terms, destination_path, engine)
+            return
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(engine, self._get_worker_container_factory())
+        ) as executor:
+            futures = {
+                executor.submit(_obfuscate_in_worker, job, engine): index
+                for index, job in enumerate(jobs)
+            }
+            try:
+                # Collect results as documents complete, whatever their order
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = self._obfuscation_service.create_error_result(
+                            error=f"Error processing {jobs[index][0]}: {str(e)}",
+                            engine=engine
+                        )
+                    yield index, result
+            finally:
+                for future in futures:
+                    future.cancel()
+    
+    def _get_worker_container_factory(self) -> Callable[[], DependencyContainer]:
+        """
+        Get the factory used by worker processes to rebuild the dependency container.
+        
+        Returns:
+            Callable[[], DependencyContainer]: Picklable container factory
+            
+        Raises:
+            ObfuscationError: If the application was given a container but no
+                factory, since workers could not reproduce its configuration
+        """
+        if self._container_factory is None:
+            raise ObfuscationError(
+                "Batch processing in several worker processes needs a container_factory "
+                "reproducing the application's dependency container; pass one to "
+                "PdfObfuscationApplication or use max_workers=1"
+            )
+        return self._container_factory
     
     def evaluate_quality(
         self,
@@ -147,12 +364,11 @@ class PdfObfuscationApplication:
         try:
             # Get quality evaluator and file storage from container
             quality_evaluator = self._dependency_container.get_quality_evaluator(evaluator_type)
-            file_storage = self._dependency_container.get_file_storage()
             
             # Execute quality evaluation directly (use case logic integrated)
             return self._execute_quality_evaluation(
                 quality_evaluator=quality_evaluator,
-                file_storage=file_storage,
+                file_storage=self._file_storage,
                 original_document_path=original_document_path,
                 obfuscated_document_path=obfuscated_document_path,
                 terms_to_obfuscate=terms_to_obfuscate,
@@ -161,6 +377,70 @@ class PdfObfuscationApplication:
         except Exception as e:
             raise ObfuscationError(f"Error during quality evaluation: {str(e)}")
     
+    async def evaluate_quality_async(self, *args, **kwargs) -> QualityReport:
+        """
+        Asynchronous variant of evaluate_quality, run in a worker thread.
+        
+        Calls are serialized with those of obfuscate_document_async, as they share
+        the container's processors and text extractors. Use evaluate_quality_batch
+        to evaluate several documents in parallel.
+        
+        Args:
+            *args: Positional arguments of evaluate_quality
+            **kwargs: Keyword arguments of evaluate_quality
+            
+        Returns:
+            QualityReport: Complete quality evaluation report
+        """
+        return await asyncio.to_thread(self._run_serialized, self.evaluate_quality, *args, **kwargs)
+    
+    def _run_serialized(self, function: Callable, *args, **kwargs):
+        """Run a function while holding the lock serializing the asynchronous calls."""
+        with self._async_lock:
+            return function(*args, **kwargs)
+    
+    def evaluate_quality_batch(
+        self,
+        pairs: List[Tuple[str, str, List[str], str]],
+        evaluator_type: str = "tesseract",
+        max_workers: Optional[int] = None
+    ) -> List[QualityReport]:
+        """
+        Evaluate the obfuscation quality of several documents in parallel worker processes.
+        
+        Each worker process builds its own application (with a container from
+        the application's container_factory) and text extractor once, then
+        evaluates whole (original, obfuscated) pairs.
+        
+        Args:
+            pairs: (original path, obfuscated path, terms, engine used) for each document
+            evaluator_type: Type of evaluator to use (tesseract or mistral)
+            max_workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            List[QualityReport]: One report per pair, in the order of pairs
+            
+        Raises:
+            ObfuscationError: If the evaluation of any pair fails, or if several
+                workers are used and the application has no container_factory
+        """
+        if not pairs:
+            return []
+        
+        max_workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+        if max_workers == 1:
+            return [
+                self.evaluate_quality(original_path, obfuscated_path, terms, engine_used, evaluator_type)
+                for original_path, obfuscated_path, terms, engine_used in pairs
+            ]
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_quality_worker,
+            initargs=(evaluator_type, self._get_worker_container_factory())
+        ) as executor:
+            return list(executor.map(_evaluate_in_worker, pairs, [evaluator_type] * len(pairs)))
+    
     def get_supported_engines(self) -> List[str]:
         """
         Returns the list of supported obfuscation engines.
@@ -168,90 +448,102 @@ class PdfObfuscationApplication:
         Returns:
             List[str]: List of supported engines
         """
-        return self._dependency_container.get_configuration_service().get_supported_engines()
+        return self._config_service.get_supported_engines()
     
-    def validate_document(self, document_path: str) -> bool:
+    def validate_document(self, document_path: str, deep: bool = False) -> bool:
         """
         Validates that a document can be processed.
         
+        By default only the PDF header and end-of-file marker are checked,
+        which reads a few bytes instead of parsing the whole document.
+        
         Args:
             document_path: Path to the document
+            deep: Also parse the document with the default engine
             
         Returns:
             bool: True if the document is valid
         """
         try:
-            file_storage = self._dependency_container.get_file_storage()
-            if not file_storage.file_exists(document_path):
-                return False
-                
             if not document_path.lower().endswith('.pdf'):
                 return False
+            
+            # Readers accept the header and trailer marker within 1 KB of each end
+            # (a missing file fails the read)
+            if b"%PDF-" not in self._file_storage.read_file_range(document_path, 0, 1024):
+                return False
+            if b"%%EOF" not in self._file_storage.read_file_range(document_path, -1024, 1024):
+                return False
+            
+            if not deep:
+                return True
                 
             # Try to open the document with the processor
-            document = Document(path=document_path)
-            # Basic test - try to extract text
-            test_term = Term(text="test")
             pdf_processor = self._dependency_container.get_pdf_processor(self._default_engine)
-            pdf_processor.extract_text_occurrences(document, test_term)
+            pdf_processor.probe(Document(path=document_path))
             
             return True
             
-        except Exception:
+        except (OSError, ImportError, ObfuscationError, DocumentProcessingError, FileStorageError) as e:
+            # Adapters wrap engine and storage failures; anything else is a bug and propagates
+            logger.debug("Document %s is not valid: %s", document_path, e)
             return False
     
     def _execute_obfuscation(
         self,
         processor: PdfProcessorPort,
+        engine: str,
         file_storage: FileStoragePort,
         obfuscation_service: DocumentObfuscationService,
-        source_path: str,
-        terms: List[str],
+        document: Document,
+        term_objects: List[Term],
         dest_path: str
     ) -> ObfuscationResult:
         """Execute obfuscation logic (replaces ObfuscateDocumentUseCase)."""
         try:
-            # Create document
-            document = Document(path=source_path)
-            
-            # Create Term objects
-            term_objects = [Term(text=term) for term in terms]
-            
-            # Extract occurrences for all terms
-            all_occurrences = []
-            for term in term_objects:
-                occurrences = processor.extract_text_occurrences(document, term)
-                all_occurrences.extend(occurrences)
+            # Read the document once for both the search and the obfuscation
+            if document.data is None:
+                document = Document(path=document.path, data=file_storage.read_file(document.path))
+            
+            # Find and obfuscate all terms, masking boxes nested in another occurrence only once
+            local_path = file_storage.get_local_path(dest_path)
+            if local_path is not None:
+                # Search and redact the same opened document, saving straight to disk
+                all_occurrences = processor.find_and_obfuscate_to(
+                    document, term_objects, local_path, obfuscation_service.remove_nested_occurrences
+                )
+            else:
+                all_occurrences = processor.extract_all_occurrences(document, term_objects)
+                if all_occurrences:
+                    obfuscated_content = processor.obfuscate_occurrences(
+                        document, obfuscation_service.remove_nested_occurrences(all_occurrences)
+                    )
+                    file_storage.write_file(dest_path, obfuscated_content)
             
             # Create results by term
             term_results = obfuscation_service.create_term_results(term_objects, all_occurrences)
             
             if all_occurrences:
-                # Obfuscate document
-                obfuscated_content = processor.obfuscate_occurrences(document, all_occurrences)
-                
-                # Save obfuscated document
-                file_storage.write_file(dest_path, obfuscated_content)
                 output_document = Document(path=dest_path)
                 
                 # Create success result
                 result = obfuscation_service.create_success_result(
                     output_document=output_document,
                     term_results=term_results,
-                    engine=self._get_engine_name(processor)
+                    engine=self._get_engine_display_name(engine)
                 )
             else:
                 # No occurrences found
                 result = obfuscation_service.create_error_result(
                     error="No terms found in the document",
                     term_results=term_results,
-                    engine=self._get_engine_name(processor)
+                    engine=self._get_engine_display_name(engine)
                 )
             
             return result
             
         except Exception as e:
-            raise DocumentProcessingError(f"Error during document obfuscation {source_path}: {str(e)}")
+            raise DocumentProcessingError(f"Error during document obfuscation {document.path}: {str(e)}")
     
     def _execute_quality_evaluation(
         self,
@@ -260,7 +552,8 @@ class PdfObfuscationApplication:
         original_document_path: str,
         obfuscated_document_path: str,
         terms_to_obfuscate: List[str],
-        engine_used: str
+        engine_used: str,
+        check_files: bool = True
     ) -> QualityReport:
         """Execute quality evaluation logic (replaces EvaluateObfuscationQualityUseCase)."""
         try:
@@ -271,20 +564,24 @@ class PdfObfuscationApplication:
             if not terms_to_obfuscate:
                 raise DocumentProcessingError("At least one term must be specified for evaluation")
             
-            # Check that files exist
-            if not file_storage.file_exists(original_document_path):
+            # Check that files exist, unless the caller just accessed them
+            if check_files and not file_storage.file_exists(original_document_path):
                 raise DocumentProcessingError(f"Original document {original_document_path} does not exist")
             
-            if not file_storage.file_exists(obfuscated_document_path):
+            if check_files and not file_storage.file_exists(obfuscated_document_path):
                 raise DocumentProcessingError(f"Obfuscated document {obfuscated_document_path} does not exist")
             
             # Create document objects
             original_document = Document(path=original_document_path)
             obfuscated_document = Document(path=obfuscated_document_path)
             
-            # Extract text once and reuse for all evaluations
-            original_extraction = quality_evaluator._text_extractor.extract_text(original_document)
-            obfuscated_extraction = quality_evaluator._text_extractor.extract_text(obfuscated_document)
+            # Extract text once and reuse for all evaluations; the two documents
+            # are independent, so they are OCR'd concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                original_future = executor.submit(quality_evaluator.extract_text, original_document)
+                obfuscated_future = executor.submit(quality_evaluator.extract_text, obfuscated_document)
+                original_extraction = original_future.result()
+                obfuscated_extraction = obfuscated_future.result()
             
             # Evaluate completeness
             completeness_result = quality_evaluator.evaluate_completeness(
@@ -311,16 +608,13 @@ class PdfObfuscationApplication:
                 "visual_integrity": visual_integrity_result
             }
             
-            # Create quality report using the quality evaluation service
-            from src.domain.services.quality_evaluation_service import QualityEvaluationService
-            quality_service = QualityEvaluationService(quality_evaluator._text_extractor)
-            
             # Get quality annotation from text extractor
             quality_annotation = None
             if hasattr(quality_evaluator._text_extractor, 'get_quality_annotation'):
-                quality_annotation = quality_evaluator._text_extractor.get_quality_annotation()
+                quality_annotation = quality_evaluator._text_extractor.get_quality_annotation(obfuscated_document)
             
-            report = quality_service.create_quality_report(
+            # Create quality report with the evaluator (a QualityEvaluationService)
+            report = quality_evaluator.create_quality_report(
                 original_document_path=original_document_path,
                 obfuscated_document_path=obfuscated_document_path,
                 terms_to_obfuscate=terms_to_obfuscate,
@@ -337,10 +631,6 @@ class PdfObfuscationApplication:
         except Exception as e:
             raise DocumentProcessingError(f"Error during quality evaluation: {str(e)}")
     
-    def _get_engine_name(self, processor: PdfProcessorPort) -> str:
-        """Get the name of the current PDF processor engine."""
-        try:
-            engine_info = processor.get_engine_info()
-            return engine_info.get("name", "unknown")
-        except:
-            return "unknown" 
\ No newline at end of file
+    def _get_engine_display_name(self, engine_key: str) -> str:
+        """Get the display name of an engine, as registered in the PDF processor factory."""
+        return self._dependency_container.get_pdf_processor_factory().get_engine_info(engine_key)["name"]
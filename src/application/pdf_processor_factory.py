@@ -2,44 +2,81 @@
 Factory for creating PDF processors.
 Uses dependency injection to respect hexagonal architecture.
 """
-from typing import Dict, Any, Type
+import importlib
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Mapping, Optional, Tuple, Type, Union
 from ..ports.pdf_processor_factory_port import PdfProcessorFactoryPort
 from ..ports.pdf_processor_port import PdfProcessorPort
 from ..ports.file_storage_port import FileStoragePort
 from ..domain.exceptions import ObfuscationError
 
 
+# Loaders are either callables returning a processor class or "module:Class"
+# paths (relative to this package or absolute), imported on first use
+ProcessorLoader = Union[str, Callable[[], Type[PdfProcessorPort]]]
+
+# Each engine's adapter is imported on its own, so using one engine does not
+# load the libraries of the others
+_DEFAULT_PROCESSOR_LOADERS: Dict[str, ProcessorLoader] = {
+    "pymupdf": "..adapters.pymupdf_adapter:PyMuPdfAdapter",
+    "pypdfium2": "..adapters.pypdfium2_adapter:PyPdfium2Adapter",
+    "pdfplumber": "..adapters.pdfplumber_adapter:PdfPlumberAdapter"
+}
+
+
+def _load_processor_class(loader: ProcessorLoader) -> Type[PdfProcessorPort]:
+    """
+    Resolve a processor loader to the processor class.
+    
+    Args:
+        loader: Callable returning the class, or "module:Class" path
+        
+    Returns:
+        Type[PdfProcessorPort]: Processor class
+    """
+    if callable(loader):
+        return loader()
+    module_name, _, class_name = loader.partition(":")
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
+
 class PdfProcessorFactory(PdfProcessorFactoryPort):
     """Factory for creating PDF processors using dependency injection."""
     
-    def __init__(self, processor_classes: Dict[str, Type[PdfProcessorPort]]):
+    def __init__(self, processor_loaders: Optional[Dict[str, ProcessorLoader]] = None):
         """
-        Initialize the factory with processor classes.
+        Initialize the factory with processor class loaders.
         
         Args:
-            processor_classes: Dictionary mapping engine names to processor classes
+            processor_loaders: Dictionary mapping engine names to callables returning
+                the processor class or to "module:Class" paths
+                (default: loaders of the built-in engines)
         """
-        self._processor_classes = processor_classes
-        self._supported_engines = {
-            "pymupdf": {
+        self._processor_loaders = dict(_DEFAULT_PROCESSOR_LOADERS if processor_loaders is None else processor_loaders)
+        # Classes already returned by their loader, so each engine is imported once
+        self._processor_classes: Dict[str, Type[PdfProcessorPort]] = {}
+        # Engine information is stored read-only, so it can be returned without copying
+        self._supported_engines: Dict[str, Mapping[str, Any]] = {
+            "pymupdf": MappingProxyType({
                 "name": "PyMuPDF",
                 "version": "1.26.3+",
                 "description": "Fast PDF processing with PyMuPDF",
-                "capabilities": ["text_extraction", "obfuscation", "flattening"]
-            },
-            "pypdfium2": {
+                "capabilities": ("text_extraction", "obfuscation", "flattening")
+            }),
+            "pypdfium2": MappingProxyType({
                 "name": "PyPDFium2",
                 "version": "4.30.0+",
                 "description": "Google PDFium-based processing",
-                "capabilities": ["text_extraction", "obfuscation", "flattening"]
-            },
-            "pdfplumber": {
+                "capabilities": ("text_extraction", "obfuscation", "flattening")
+            }),
+            "pdfplumber": MappingProxyType({
                 "name": "pdfplumber",
                 "version": "0.10.0+",
                 "description": "Text extraction focused processing",
-                "capabilities": ["text_extraction", "obfuscation"]
-            }
+                "capabilities": ("text_extraction", "obfuscation")
+            })
         }
+        self._engine_names: Optional[Tuple[str, ...]] = None
     
     def create_processor(self, engine: str, file_storage: FileStoragePort) -> PdfProcessorPort:
         """
@@ -59,20 +96,26 @@ class PdfProcessorFactory(PdfProcessorFactoryPort):
             supported = ", ".join(self._supported_engines.keys())
             raise ObfuscationError(f"Engine '{engine}' not supported. Available engines: {supported}")
         
-        if engine not in self._processor_classes:
-            raise ObfuscationError(f"No processor class registered for engine '{engine}'")
+        processor_class = self._processor_classes.get(engine)
+        if processor_class is None:
+            loader = self._processor_loaders.get(engine)
+            if loader is None:
+                raise ObfuscationError(f"No processor class registered for engine '{engine}'")
+            # Import errors of the engine library propagate unchanged
+            processor_class = self._processor_classes[engine] = _load_processor_class(loader)
         
         try:
-            processor_class = self._processor_classes[engine]
             return processor_class(file_storage)
         except Exception as e:
             raise ObfuscationError(f"Failed to create processor for engine '{engine}': {str(e)}")
     
     def get_supported_engines(self) -> list[str]:
         """Get list of supported engine names."""
-        return list(self._supported_engines.keys())
+        if self._engine_names is None:
+            self._engine_names = tuple(self._supported_engines)
+        return list(self._engine_names)
     
-    def get_engine_info(self, engine: str) -> Dict[str, Any]:
+    def get_engine_info(self, engine: str) -> Mapping[str, Any]:
         """
         Get information about a specific engine.
         
@@ -80,7 +123,8 @@ class PdfProcessorFactory(PdfProcessorFactoryPort):
             engine: Engine name
             
         Returns:
-            Engine information dictionary
+            Read-only engine information mapping (list values are tuples);
+            use dict(...) for a mutable or JSON-serializable copy
             
         Raises:
             ObfuscationError: If engine is not supported
@@ -89,17 +133,29 @@ class PdfProcessorFactory(PdfProcessorFactoryPort):
             supported = ", ".join(self._supported_engines.keys())
             raise ObfuscationError(f"Engine '{engine}' not supported. Available engines: {supported}")
         
-        return self._supported_engines[engine].copy()
+        return self._supported_engines[engine]
     
-    def register_engine(self, engine_name: str, engine_info: Dict[str, Any]) -> None:
+    def register_engine(
+        self,
+        engine_name: str,
+        engine_info: Dict[str, Any],
+        loader: Optional[ProcessorLoader] = None
+    ) -> None:
         """
         Register a new engine with the factory.
         
         Args:
             engine_name: Name of the engine to register
             engine_info: Engine information dictionary
+            loader: Callable returning the engine's processor class, or its
+                "module:Class" path, resolved on first use (default: keep the
+                engine's current loader, if any)
         """
-        self._supported_engines[engine_name] = engine_info.copy()
+        self._supported_engines[engine_name] = MappingProxyType(dict(engine_info))
+        self._engine_names = None
+        if loader is not None:
+            self._processor_loaders[engine_name] = loader
+            self._processor_classes.pop(engine_name, None)
     
     def unregister_engine(self, engine_name: str) -> bool:
         """
@@ -113,5 +169,8 @@ class PdfProcessorFactory(PdfProcessorFactoryPort):
         """
         if engine_name in self._supported_engines:
             del self._supported_engines[engine_name]
+            self._engine_names = None
+            self._processor_loaders.pop(engine_name, None)
+            self._processor_classes.pop(engine_name, None)
             return True
         return False
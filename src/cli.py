@@ -6,13 +6,166 @@ import argparse
 import sys
 import json
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
-from src.application.pdf_obfuscation_app import PdfObfuscationApplication
+if TYPE_CHECKING:
+    from src.application.pdf_obfuscation_app import PdfObfuscationApplication
+    from src.domain.entities import ObfuscationResult, QualityReport
 
 
-def main():
-    """Main entry point for CLI interface."""
+def _build_app() -> "PdfObfuscationApplication":
+    """
+    Create the application with a fresh dependency container.
+    
+    The application is imported here rather than at module level, so --help
+    and argument errors are answered without loading the domain and adapters.
+    """
+    from src.application.dependency_container import DependencyContainer
+    from src.application.pdf_obfuscation_app import PdfObfuscationApplication
+    
+    return PdfObfuscationApplication(dependency_container=DependencyContainer())
+
+
+def _print_json(data: dict) -> None:
+    """
+    Write data to stdout as JSON, without building the whole string first.
+    
+    Output is indented for a terminal and compact when piped to another program.
+    """
+    if sys.stdout.isatty():
+        json.dump(data, sys.stdout, indent=2)
+    else:
+        json.dump(data, sys.stdout, separators=(",", ":"))
+    sys.stdout.write("\n")
+
+
+def _get_processing_mode(result: "QualityReport") -> str:
+    """Get the processing mode recorded in the quality annotation of a report."""
+    annotation = getattr(result, 'quality_annotation', None)
+    if not annotation:
+        return 'unknown'
+    if isinstance(annotation, dict):
+        return annotation.get('processing_mode', 'unknown')
+    if isinstance(annotation, str):
+        try:
+            return json.loads(annotation).get('processing_mode', 'unknown')
+        except json.JSONDecodeError:
+            return 'unknown'
+    return getattr(annotation, 'processing_mode', 'unknown')
+
+
+def _print_quality_result(result: "QualityReport", output_format: str) -> None:
+    """Display a quality evaluation report in the requested output format."""
+    processing_mode = _get_processing_mode(result)
+    
+    if output_format == "json":
+        # Get OCR execution times from details
+        completeness_details = result.metrics.details.get('completeness', {}).get('details', {})
+        original_ocr_time = completeness_details.get('original_ocr_time', 'N/A')
+        obfuscated_ocr_time = completeness_details.get('obfuscated_ocr_time', 'N/A')
+        
+        output_data = {
+            "overall_score": result.metrics.overall_score,
+            "completeness_score": result.metrics.completeness_score,
+            "precision_score": result.metrics.precision_score,
+            "visual_integrity_score": result.metrics.visual_integrity_score,
+            "processing_mode": processing_mode,
+            "timestamp": result.timestamp,
+            "details": result.metrics.details,
+            "ocr_execution_times": {
+                "original_document": original_ocr_time,
+                "obfuscated_document": obfuscated_ocr_time
+            }
+        }
+        _print_json(output_data)
+    else:
+        print(f"Quality evaluation completed. Overall score: {result.metrics.overall_score}")
+        print(f"Completeness: {result.metrics.completeness_score}")
+        print(f"Precision: {result.metrics.precision_score}")
+        print(f"Visual Integrity: {result.metrics.visual_integrity_score}")
+        print(f"Processing mode: {processing_mode}")
+        
+        # Display details
+        if result.metrics.details:
+            print("\nDetails:")
+            
+            # Completeness details
+            if 'completeness' in result.metrics.details:
+                comp_details = result.metrics.details['completeness']
+                print(f"  Completeness Details:")
+                print(f"    Total terms found: {comp_details.get('total_terms_found', 'N/A')}")
+                print(f"    Successfully obfuscated: {comp_details.get('successfully_obfuscated', 'N/A')}")
+                if comp_details.get('remaining_terms'):
+                    print(f"    Remaining terms: {comp_details['remaining_terms']}")
+            
+            # Precision details
+            if 'precision' in result.metrics.details:
+                prec_details = result.metrics.details['precision']
+                print(f"  Precision Details:")
+                print(f"    Total original words: {prec_details.get('total_original_words', 'N/A')}")
+                print(f"    Words found: {prec_details.get('words_found', 'N/A')}")
+                if prec_details.get('missing_words'):
+                    print(f"    Missing words: {prec_details['missing_words']}")
+            
+            # Visual integrity details
+            if 'visual_integrity' in result.metrics.details:
+                vis_details = result.metrics.details['visual_integrity']
+                print(f"  Visual Integrity Details:")
+                print(f"    Page count match: {vis_details.get('page_count_match', 'N/A')}")
+                print(f"    Dimension matches: {vis_details.get('dimension_matches', 'N/A')}")
+                if vis_details.get('size_differences'):
+                    print(f"    Size differences: {vis_details['size_differences']}")
+
+
+def _print_obfuscation_result(result: "ObfuscationResult", output_format: str) -> None:
+    """Display an obfuscation result in the requested output format."""
+    if output_format == "json":
+        # JSON output
+        output_data = {
+            "success": result.success,
+            "message": result.message,
+            "output_document": result.output_document.path if result.output_document else None,
+            "total_terms_processed": result.total_terms_processed,
+            "total_occurrences_obfuscated": result.total_occurrences_obfuscated,
+            "term_results": [
+                {
+                    "term": tr.term.text,
+                    "status": tr.status.value,
+                    "occurrences_count": tr.occurrences_count,
+                    "message": tr.message
+                }
+                for tr in result.term_results
+            ],
+            "error": result.error
+        }
+        if result.quality_report:
+            output_data["quality_score"] = result.quality_report.metrics.overall_score
+        _print_json(output_data)
+    else:
+        # Text output
+        print(f"Status: {'Success' if result.success else 'Failed'}")
+        if result.message:
+            print(f"Message: {result.message}")
+        if result.output_document:
+            print(f"Output: {result.output_document.path}")
+        print(f"Terms processed: {result.total_terms_processed}")
+        print(f"Occurrences obfuscated: {result.total_occurrences_obfuscated}")
+        
+        if result.term_results:
+            print("\nDetails by term:")
+            for tr in result.term_results:
+                status_icon = "✅" if tr.status.value == "success" else "❌"
+                print(f"  {status_icon} '{tr.term.text}': {tr.occurrences_count} occurrences - {tr.message}")
+        
+        if result.quality_report:
+            print(f"\nQuality evaluation completed. Overall score: {result.quality_report.metrics.overall_score}")
+        
+        if result.error:
+            print(f"Error: {result.error}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(
         description="Obfuscate terms in a PDF document or evaluate obfuscation quality",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -93,28 +246,38 @@ Examples:
         help="Verbose mode"
     )
     
-    args = parser.parse_args()
-    
-    # Initialize application with dependency container
-    from src.application.dependency_container import DependencyContainer
-    
-    # Create dependency container
-    container = DependencyContainer()
+    return parser
+
+
+# Built on first use and reused by later calls to main() in the same process
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main entry point for CLI interface.
     
-    # Configure container with chosen evaluator
-    if args.evaluator == "mistral":
-        # Pre-configure container to use Mistral evaluator
-        container.get_quality_evaluator("mistral")
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+        
+    Returns:
+        int: Process exit code
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    args = _PARSER.parse_args(argv)
     
-    # Create application with the container
-    app = PdfObfuscationApplication(dependency_container=container)
+    # Create application with its dependency container. The quality evaluator
+    # (and its OCR client) is only built when a command evaluates quality
+    app = _build_app()
     
     try:
         # Command to list engines
         if args.engines:
             engines = app.get_supported_engines()
             if args.format == "json":
-                print(json.dumps({"engines": engines}, indent=2))
+                _print_json({"engines": engines})
             else:
                 print("Available obfuscation engines:")
                 for engine in engines:
@@ -128,7 +291,7 @@ Examples:
                 return 1
             is_valid = app.validate_document(args.document)
             if args.format == "json":
-                print(json.dumps({"valid": is_valid, "document": args.document}))
+                _print_json({"valid": is_valid, "document": args.document})
             else:
                 status = "valid" if is_valid else "invalid"
                 print(f"Document {args.document}: {status}")
@@ -164,91 +327,7 @@ Examples:
             )
             
             # Display quality evaluation results
-            if args.format == "json":
-                # Get OCR execution times from details
-                completeness_details = result.metrics.details.get('completeness', {}).get('details', {})
-                original_ocr_time = completeness_details.get('original_ocr_time', 'N/A')
-                obfuscated_ocr_time = completeness_details.get('obfuscated_ocr_time', 'N/A')
-                
-                # Get processing mode from quality annotation
-                processing_mode = 'unknown'
-                if hasattr(result, 'quality_annotation') and result.quality_annotation:
-                    if isinstance(result.quality_annotation, dict):
-                        processing_mode = result.quality_annotation.get('processing_mode', 'unknown')
-                    elif isinstance(result.quality_annotation, str):
-                        try:
-                            annotation_dict = json.loads(result.quality_annotation)
-                            processing_mode = annotation_dict.get('processing_mode', 'unknown')
-                        except json.JSONDecodeError:
-                            processing_mode = 'unknown'
-                    else:
-                        processing_mode = getattr(result.quality_annotation, 'processing_mode', 'unknown')
-                
-                output_data = {
-                    "overall_score": result.metrics.overall_score,
-                    "completeness_score": result.metrics.completeness_score,
-                    "precision_score": result.metrics.precision_score,
-                    "visual_integrity_score": result.metrics.visual_integrity_score,
-                    "processing_mode": processing_mode,
-                    "timestamp": result.timestamp,
-                    "details": result.metrics.details,
-                    "ocr_execution_times": {
-                        "original_document": original_ocr_time,
-                        "obfuscated_document": obfuscated_ocr_time
-                    }
-                }
-                print(json.dumps(output_data, indent=2))
-            else:
-                # Get processing mode from quality annotation
-                processing_mode = 'unknown'
-                if hasattr(result, 'quality_annotation') and result.quality_annotation:
-                    if isinstance(result.quality_annotation, dict):
-                        processing_mode = result.quality_annotation.get('processing_mode', 'unknown')
-                    elif isinstance(result.quality_annotation, str):
-                        try:
-                            annotation_dict = json.loads(result.quality_annotation)
-                            processing_mode = annotation_dict.get('processing_mode', 'unknown')
-                        except json.JSONDecodeError:
-                            processing_mode = 'unknown'
-                    else:
-                        processing_mode = getattr(result.quality_annotation, 'processing_mode', 'unknown')
-                
-                print(f"Quality evaluation completed. Overall score: {result.metrics.overall_score}")
-                print(f"Completeness: {result.metrics.completeness_score}")
-                print(f"Precision: {result.metrics.precision_score}")
-                print(f"Visual Integrity: {result.metrics.visual_integrity_score}")
-                print(f"Processing mode: {processing_mode}")
-                
-                # Display details
-                if result.metrics.details:
-                    print("\nDetails:")
-                    
-                    # Completeness details
-                    if 'completeness' in result.metrics.details:
-                        comp_details = result.metrics.details['completeness']
-                        print(f"  Completeness Details:")
-                        print(f"    Total terms found: {comp_details.get('total_terms_found', 'N/A')}")
-                        print(f"    Successfully obfuscated: {comp_details.get('successfully_obfuscated', 'N/A')}")
-                        if comp_details.get('remaining_terms'):
-                            print(f"    Remaining terms: {comp_details['remaining_terms']}")
-                    
-                    # Precision details
-                    if 'precision' in result.metrics.details:
-                        prec_details = result.metrics.details['precision']
-                        print(f"  Precision Details:")
-                        print(f"    Total original words: {prec_details.get('total_original_words', 'N/A')}")
-                        print(f"    Words found: {prec_details.get('words_found', 'N/A')}")
-                        if prec_details.get('missing_words'):
-                            print(f"    Missing words: {prec_details['missing_words']}")
-                    
-                    # Visual integrity details
-                    if 'visual_integrity' in result.metrics.details:
-                        vis_details = result.metrics.details['visual_integrity']
-                        print(f"  Visual Integrity Details:")
-                        print(f"    Page count match: {vis_details.get('page_count_match', 'N/A')}")
-                        print(f"    Dimension matches: {vis_details.get('dimension_matches', 'N/A')}")
-                        if vis_details.get('size_differences'):
-                            print(f"    Size differences: {vis_details['size_differences']}")
+            _print_quality_result(result, args.format)
             
             return 0
         
@@ -282,44 +361,7 @@ Examples:
         )
         
         # Display results
-        if args.format == "json":
-            # JSON output
-            output_data = {
-                "success": result.success,
-                "message": result.message,
-                "output_document": result.output_document.path if result.output_document else None,
-                "total_terms_processed": result.total_terms_processed,
-                "total_occurrences_obfuscated": result.total_occurrences_obfuscated,
-                "term_results": [
-                    {
-                        "term": tr.term.text,
-                        "status": tr.status.value,
-                        "occurrences_count": tr.occurrences_count,
-                        "message": tr.message
-                    }
-                    for tr in result.term_results
-                ],
-                "error": result.error
-            }
-            print(json.dumps(output_data, indent=2))
-        else:
-            # Text output
-            print(f"Status: {'Success' if result.success else 'Failed'}")
-            if result.message:
-                print(f"Message: {result.message}")
-            if result.output_document:
-                print(f"Output: {result.output_document.path}")
-            print(f"Terms processed: {result.total_terms_processed}")
-            print(f"Occurrences obfuscated: {result.total_occurrences_obfuscated}")
-            
-            if result.term_results:
-                print("\nDetails by term:")
-                for tr in result.term_results:
-                    status_icon = "✅" if tr.status.value == "success" else "❌"
-                    print(f"  {status_icon} '{tr.term.text}': {tr.occurrences_count} occurrences - {tr.message}")
-            
-            if result.error:
-                print(f"Error: {result.error}")
+        _print_obfuscation_result(result, args.format)
         
         return 0 if result.success else 1
         
@@ -2,8 +2,8 @@
 Domain entities for PDF obfuscation.
 Pure business objects with no external dependencies.
 """
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 from pydantic import BaseModel
 
@@ -108,6 +108,8 @@ class TextExtractionResult:
 class Document:
     """A document to be processed."""
     path: str
+    # Content already loaded by the caller; processors use it instead of reading path
+    data: Optional[bytes] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.path or not self.path.strip():
@@ -141,6 +143,7 @@ class ObfuscationResult:
     total_occurrences_obfuscated: int
     message: str
     error: Optional[str] = None
+    quality_report: Optional[QualityReport] = None
     
     @property
     def has_errors(self) -> bool:
@@ -153,6 +156,20 @@ class ObfuscationResult:
         return [result for result in self.term_results if result.was_found]
 
 
+@dataclass(frozen=True)
+class BatchResult:
+    """Result of the obfuscation of a batch of documents."""
+    successful: List[Tuple[str, ObfuscationResult]]
+    failed: List[Tuple[str, ObfuscationResult]]
+    total_processed: int
+    processing_time: float
+    
+    @property
+    def all_succeeded(self) -> bool:
+        """Whether every processed document was obfuscated."""
+        return not self.failed
+
+
 # API Models for FastAPI
 class TermRequest(BaseModel):
     """Term in request."""
@@ -4,7 +4,7 @@ Centralizes all configuration parameters and default values.
 """
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -20,7 +20,7 @@ class PathConfiguration:
 class EngineConfiguration:
     """Configuration for processing engines."""
     default_engine: str
-    supported_engines: List[str]
+    supported_engines: Tuple[str, ...]
     engine_timeout: int
 
 
@@ -28,8 +28,10 @@ class EngineConfiguration:
 class QualityConfiguration:
     """Configuration for quality evaluation."""
     default_evaluator: str
-    supported_evaluators: List[str]
+    supported_evaluators: Tuple[str, ...]
     quality_threshold: float
+    ocr_cache_directory: Optional[str] = None
+    ocr_use_text_layer: bool = False
 
 
 class ConfigurationService:
@@ -40,6 +42,9 @@ class ConfigurationService:
         self._path_config = self._create_path_configuration()
         self._engine_config = self._create_engine_configuration()
         self._quality_config = self._create_quality_configuration()
+        # Sets for the validations run on every request
+        self._supported_engine_set = frozenset(self._engine_config.supported_engines)
+        self._supported_evaluator_set = frozenset(self._quality_config.supported_evaluators)
     
     def get_default_output_path(self, input_path: str) -> str:
         """
@@ -67,7 +72,7 @@ class ConfigurationService:
     
     def get_supported_engines(self) -> List[str]:
         """Get list of supported processing engines."""
-        return self._engine_config.supported_engines.copy()
+        return list(self._engine_config.supported_engines)
     
     def get_default_engine(self) -> str:
         """Get default processing engine."""
@@ -83,7 +88,7 @@ class ConfigurationService:
     
     def get_supported_evaluators(self) -> List[str]:
         """Get list of supported quality evaluators."""
-        return self._quality_config.supported_evaluators.copy()
+        return list(self._quality_config.supported_evaluators)
     
     def get_default_evaluator(self) -> str:
         """Get default quality evaluator."""
@@ -93,6 +98,14 @@ class ConfigurationService:
         """Get quality threshold for evaluation."""
         return self._quality_config.quality_threshold
     
+    def get_ocr_cache_directory(self) -> Optional[str]:
+        """Get directory where OCR results are cached (None if caching is disabled)."""
+        return self._quality_config.ocr_cache_directory
+    
+    def get_ocr_use_text_layer(self) -> bool:
+        """Get whether OCR takes the text of pages with a text layer from it instead of OCRing them."""
+        return self._quality_config.ocr_use_text_layer
+    
     def get_engine_timeout(self) -> int:
         """Get timeout for engine operations."""
         return self._engine_config.engine_timeout
@@ -107,7 +120,7 @@ class ConfigurationService:
         Returns:
             True if engine is supported
         """
-        return engine in self._engine_config.supported_engines
+        return engine in self._supported_engine_set
     
     def validate_evaluator(self, evaluator: str) -> bool:
         """
@@ -119,7 +132,7 @@ class ConfigurationService:
         Returns:
             True if evaluator is supported
         """
-        return evaluator in self._quality_config.supported_evaluators
+        return evaluator in self._supported_evaluator_set
     
     def _create_path_configuration(self) -> PathConfiguration:
         """Create path configuration with defaults and environment overrides."""
@@ -133,7 +146,7 @@ class ConfigurationService:
         """Create engine configuration with defaults and environment overrides."""
         return EngineConfiguration(
             default_engine=os.getenv("PDF_DEFAULT_ENGINE", "pymupdf"),
-            supported_engines=["pymupdf", "pypdfium2", "pdfplumber"],
+            supported_engines=("pymupdf", "pypdfium2", "pdfplumber"),
             engine_timeout=int(os.getenv("PDF_ENGINE_TIMEOUT", "300"))
         )
     
@@ -141,6 +154,8 @@ class ConfigurationService:
         """Create quality configuration with defaults and environment overrides."""
         return QualityConfiguration(
             default_evaluator=os.getenv("PDF_DEFAULT_EVALUATOR", "tesseract"),
-            supported_evaluators=["tesseract", "mistral"],
-            quality_threshold=float(os.getenv("PDF_QUALITY_THRESHOLD", "0.8"))
+            supported_evaluators=("tesseract", "mistral"),
+            quality_threshold=float(os.getenv("PDF_QUALITY_THRESHOLD", "0.8")),
+            ocr_cache_directory=os.getenv("PDF_OCR_CACHE_DIR") or None,
+            ocr_use_text_layer=os.getenv("PDF_OCR_USE_TEXT_LAYER", "false").lower() in ("1", "true", "yes")
         )
@@ -2,6 +2,7 @@
 Domain services for PDF obfuscation.
 Pure business logic without external dependencies.
 """
+from collections import defaultdict
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -19,6 +20,62 @@ class DocumentObfuscationService:
     This service contains pure business rules and doesn't depend on external systems.
     """
     
+    def normalize_terms(self, terms: List[str]) -> List[str]:
+        """
+        Strip terms and drop empty and duplicate ones.
+        Terms are matched case-insensitively, so terms differing only by case
+        are duplicates; the first spelling is kept.
+        
+        Args:
+            terms: Terms as given by the caller
+            
+        Returns:
+            List of unique non-empty terms, in their original order
+        """
+        seen = set()
+        unique_terms = []
+        for term in terms:
+            text = term.strip()
+            key = text.lower()
+            if text and key not in seen:
+                seen.add(key)
+                unique_terms.append(text)
+        return unique_terms
+    
+    def remove_nested_occurrences(self, occurrences: List[TermOccurrence]) -> List[TermOccurrence]:
+        """
+        Drop occurrences lying entirely within another occurrence of the same page.
+        Overlapping terms (e.g. "John" and "John Smith") find nested boxes; masking
+        the outer box already hides the inner one, so it is only drawn once.
+        Terms themselves are all kept: a shorter term may also appear on its own.
+        
+        Args:
+            occurrences: Occurrences of all terms
+            
+        Returns:
+            Occurrences to mask, in their original order
+        """
+        kept_by_page: Dict[int, List[TermOccurrence]] = {}
+        # Largest boxes first, so a box is only compared with boxes that may contain it
+        for occurrence in sorted(occurrences, key=self._occurrence_area, reverse=True):
+            kept = kept_by_page.setdefault(occurrence.page_number, [])
+            inner = occurrence.position
+            if not any(
+                outer.position.x0 <= inner.x0 and outer.position.y0 <= inner.y0
+                and inner.x1 <= outer.position.x1 and inner.y1 <= outer.position.y1
+                for outer in kept
+            ):
+                kept.append(occurrence)
+        
+        kept_ids = {id(occurrence) for kept in kept_by_page.values() for occurrence in kept}
+        return [occurrence for occurrence in occurrences if id(occurrence) in kept_ids]
+    
+    @staticmethod
+    def _occurrence_area(occurrence: TermOccurrence) -> float:
+        """Area of the box of an occurrence."""
+        position = occurrence.position
+        return (position.x1 - position.x0) * (position.y1 - position.y0)
+    
     def create_term_results(self, terms: List[Term], occurrences: List[TermOccurrence]) -> List[TermResult]:
         """
         Create term results from found occurrences.
@@ -32,9 +89,14 @@ class DocumentObfuscationService:
         """
         term_results = []
         
+        # Group occurrences by term in one pass instead of scanning them for every term
+        occurrences_by_term: Dict[str, List[TermOccurrence]] = defaultdict(list)
+        for occ in occurrences:
+            occurrences_by_term[occ.term.text.lower()].append(occ)
+        
         for term in terms:
             # Find occurrences for this specific term
-            term_occurrences = [occ for occ in occurrences if occ.term.text.lower() == term.text.lower()]
+            term_occurrences = occurrences_by_term.get(term.text.lower(), [])
             
             if term_occurrences:
                 status = ProcessingStatus.SUCCESS
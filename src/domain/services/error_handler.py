@@ -2,6 +2,7 @@
 Error handler service for PDF obfuscation.
 Centralizes error handling and provides consistent error responses.
 """
+import logging
 from typing import Dict, Any, Optional, Type
 from ..entities import ObfuscationResult, QualityReport
 from ..exceptions import (
@@ -12,6 +13,8 @@ from ..exceptions import (
 )
 from ..services import DocumentObfuscationService
 
+logger = logging.getLogger(__name__)
+
 
 class ErrorContext:
     """Context information for error handling."""
@@ -69,33 +72,36 @@ class ErrorHandler:
         Returns:
             Error result with appropriate error information
         """
-        error_info = self._analyze_error(error, context)
+        # Failed documents are common in batches: only the message is needed
+        # here, so the full error analysis (context copy, timestamp) is skipped
+        message = str(error)
         
         # Create appropriate error result
         if isinstance(error, ObfuscationError):
             return self._obfuscation_service.create_error_result(
-                error=error_info["message"],
+                error=message,
                 engine=engine
             )
         elif isinstance(error, DocumentProcessingError):
             return self._obfuscation_service.create_error_result(
-                error=f"Document processing error: {error_info['message']}",
+                error=f"Document processing error: {message}",
                 engine=engine
             )
         elif isinstance(error, FileStorageError):
             return self._obfuscation_service.create_error_result(
-                error=f"File storage error: {error_info['message']}",
+                error=f"File storage error: {message}",
                 engine=engine
             )
         elif isinstance(error, ValidationError):
             return self._obfuscation_service.create_error_result(
-                error=f"Validation error: {error_info['message']}",
+                error=f"Validation error: {message}",
                 engine=engine
             )
         else:
-            # Unexpected error
+            # Unexpected error: the traceback is only formatted when debug logging is enabled
+            logger.debug("Unexpected error during %s", context.operation, exc_info=error)
             return self._obfuscation_service.create_error_result(
-                error=f"Unexpected error during {context.operation}: {error_info['message']}",
+                error=f"Unexpected error during {context.operation}: {message}",
                 engine=engine
             )
     
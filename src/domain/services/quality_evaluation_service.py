@@ -1,10 +1,15 @@
 """
 Service for evaluating obfuscation quality.
 """
+import hashlib
 import re
+import threading
 import unicodedata
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Hashable, List, Optional, Tuple
 from ..entities import Document, TextExtractionResult
+from ...ports.file_storage_port import FileStoragePort
 from ...ports.text_extractor_port import TextExtractorPort
 from ..exceptions import DocumentProcessingError
 from ..quality_annotation_schema import DocumentQualityAnnotation
@@ -34,18 +39,81 @@ def normalize_punctuation(text: str) -> str:
     return normalized_text
 
 
+@lru_cache(maxsize=32)
+def _compile_terms_pattern(lowered_terms: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """
+    Compile a regex matching any of the terms at every position of a text.
+    
+    Args:
+        lowered_terms: Lowercased terms to search for
+        
+    Returns:
+        Compiled pattern capturing the longest term starting at each position
+        (lookahead, so overlapping occurrences are all reported), or None if
+        there is no non-empty term.
+    """
+    alternatives = sorted({term for term in lowered_terms if term}, key=len, reverse=True)
+    if not alternatives:
+        return None
+    return re.compile("(?=(" + "|".join(re.escape(term) for term in alternatives) + "))")
+
 
 class QualityEvaluationService:
     """Service for evaluating obfuscation quality using text extraction."""
     
-    def __init__(self, text_extractor: TextExtractorPort):
+    # Number of extraction results kept for unchanged documents
+    _EXTRACTION_CACHE_SIZE = 8
+    
+    def __init__(self, text_extractor: TextExtractorPort, file_storage: Optional[FileStoragePort] = None):
         """
         Initialize the service.
         
         Args:
             text_extractor: Text extractor to use for OCR
+            file_storage: Storage used to detect unchanged documents so their
+                extraction can be reused (no caching if omitted)
         """
         self._text_extractor = text_extractor
+        self._file_storage = file_storage
+        self._extraction_cache: "OrderedDict[Tuple[str, Hashable], TextExtractionResult]" = OrderedDict()
+        self._extraction_cache_lock = threading.Lock()
+    
+    def extract_text(self, document: Document) -> TextExtractionResult:
+        """
+        Extract text from a document, reusing the previous result if the file has not changed.
+        Safe to call from several threads.
+        
+        Args:
+            document: Document to extract text from
+            
+        Returns:
+            TextExtractionResult containing extracted text and metadata
+        """
+        if self._file_storage is None:
+            return self._text_extractor.extract_text(document)
+        
+        if document.data is not None:
+            signature = hashlib.sha256(document.data).hexdigest()
+        else:
+            signature = self._file_storage.get_file_signature(document.path)
+        if signature is None:
+            # Storage without cheap change detection: identify the version by its content
+            signature = hashlib.sha256(self._file_storage.read_file(document.path)).hexdigest()
+        
+        cache_key = (document.path, signature)
+        with self._extraction_cache_lock:
+            extraction = self._extraction_cache.get(cache_key)
+            if extraction is not None:
+                self._extraction_cache.move_to_end(cache_key)
+                return extraction
+        
+        extraction = self._text_extractor.extract_text(document)
+        with self._extraction_cache_lock:
+            self._extraction_cache[cache_key] = extraction
+            while len(self._extraction_cache) > self._EXTRACTION_CACHE_SIZE:
+                self._extraction_cache.popitem(last=False)
+        
+        return extraction
     
     def calculate_overall_score(
         self, 
@@ -91,9 +159,9 @@ class QualityEvaluationService:
         try:
             # Extract text from both documents if not provided
             if original_extraction is None:
-                original_extraction = self._text_extractor.extract_text(original_document)
+                original_extraction = self.extract_text(original_document)
             if obfuscated_extraction is None:
-                obfuscated_extraction = self._text_extractor.extract_text(obfuscated_document)
+                obfuscated_extraction = self.extract_text(obfuscated_document)
             
             # Find terms in original document
             original_terms = self._find_terms_in_text(original_extraction.text, terms_to_obfuscate)
@@ -140,9 +208,9 @@ class QualityEvaluationService:
         try:
             # Extract text from both documents if not provided
             if original_extraction is None:
-                original_extraction = self._text_extractor.extract_text(original_document)
+                original_extraction = self.extract_text(original_document)
             if obfuscated_extraction is None:
-                obfuscated_extraction = self._text_extractor.extract_text(obfuscated_document)
+                obfuscated_extraction = self.extract_text(obfuscated_document)
             original_text = original_extraction.text
             obfuscated_text = obfuscated_extraction.text
             
@@ -243,9 +311,9 @@ class QualityEvaluationService:
         try:
             # Extract text from both documents if not provided
             if original_extraction is None:
-                original_extraction = self._text_extractor.extract_text(original_document)
+                original_extraction = self.extract_text(original_document)
             if obfuscated_extraction is None:
-                obfuscated_extraction = self._text_extractor.extract_text(obfuscated_document)
+                obfuscated_extraction = self.extract_text(obfuscated_document)
             
             # For now, we'll use a simple approach
             # In a real implementation, you might want to compare page dimensions, etc.
@@ -265,14 +333,18 @@ class QualityEvaluationService:
     
     def _find_terms_in_text(self, text: str, terms: List[str]) -> List[str]:
         """Find which terms appear in the text."""
-        found_terms = []
-        text_lower = text.lower()
+        lowered_terms = [term.lower() for term in terms]
+        pattern = _compile_terms_pattern(tuple(lowered_terms))
         
-        for term in terms:
-            if term.lower() in text_lower:
-                found_terms.append(term)
+        # Single scan of the text for all terms at once
+        matched = {match.group(1) for match in pattern.finditer(text.lower())} if pattern else set()
         
-        return found_terms
+        # The longest alternative wins at a given position, so a shorter term
+        # starting there only shows up as a prefix of a matched term
+        return [
+            term for term, lowered in zip(terms, lowered_terms)
+            if lowered in matched or any(found.startswith(lowered) for found in matched) or not lowered
+        ]
     
     def _is_word_obfuscation_target_optimized(self, missing_word: str, target_data: dict) -> bool:
         """
@@ -3,7 +3,8 @@ Port for file storage operations.
 This is an interface that defines how the domain can interact with file storage systems.
 """
 from abc import ABC, abstractmethod
-from typing import Optional
+import io
+from typing import BinaryIO, Hashable, List, Optional
 
 from ..domain.entities import Document
 
@@ -65,4 +66,98 @@ class FileStoragePort(ABC):
         Raises:
             FileStorageError: If there's an error deleting the file
         """
-        pass 
\ No newline at end of file
+        pass 
+    
+    def delete_files(self, file_paths: List[str]) -> None:
+        """
+        Delete several files.
+        
+        This method has a default implementation that deletes the files one
+        by one; storages override it when they support bulk deletion.
+        
+        Args:
+            file_paths: The file paths to delete
+            
+        Raises:
+            FileStorageError: If there's an error deleting a file
+        """
+        for file_path in file_paths:
+            self.delete_file(file_path)
+    
+    def open_file(self, file_path: str) -> BinaryIO:
+        """
+        Open a file for streamed reading.
+        
+        Args:
+            file_path: The file path to open
+            
+        Returns:
+            Readable binary stream, to be closed by the caller. This method has
+            a default implementation that loads the whole file in memory;
+            storages override it to stream the content instead.
+            
+        Raises:
+            FileStorageError: If there's an error opening the file
+        """
+        return io.BytesIO(self.read_file(file_path))
+    
+    def read_file_range(self, file_path: str, offset: int, length: int) -> bytes:
+        """
+        Read part of a file.
+        
+        Args:
+            file_path: The file path to read
+            offset: Position of the first byte; negative values count from the end of the file
+            length: Maximum number of bytes to read
+            
+        Returns:
+            Up to length bytes starting at offset (fewer at the end of the file).
+            This method has a default implementation that reads the whole file;
+            storages override it when they can read a range directly.
+            
+        Raises:
+            FileStorageError: If there's an error reading the file
+        """
+        content = self.read_file(file_path)
+        start = max(len(content) + offset, 0) if offset < 0 else offset
+        return content[start:start + length]
+    
+    def get_file_signature(self, file_path: str) -> Optional[Hashable]:
+        """
+        Get a cheap signature of the current version of a file.
+        
+        Args:
+            file_path: The file path to inspect
+            
+        Returns:
+            A hashable value that changes whenever the file content changes,
+            or None if it cannot be determined. This method has a default
+            implementation that returns None, meaning callers must not cache
+            anything derived from the file; storages override it when they
+            can provide a signature.
+        """
+        return None
+    
+    def get_local_path(self, file_path: str) -> Optional[str]:
+        """
+        Get a local file system path where a file can be written directly.
+        
+        Args:
+            file_path: The file path to write to
+            
+        Returns:
+            A local path whose parent directory exists, or None if the storage
+            is not backed by the local file system. This method has a default
+            implementation that returns None, meaning callers must go through
+            write_file; local storages override it so writers can stream to disk.
+        """
+        return None
+    
+    def close(self) -> None:
+        """
+        Release the resources held by this storage.
+        
+        The default implementation does nothing, for storages that hold no
+        resources between calls. The storage must not be used afterwards.
+        """
+        pass
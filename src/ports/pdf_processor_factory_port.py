@@ -3,7 +3,7 @@ Port for PDF processor factory.
 Defines the contract for creating PDF processors.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Mapping, Optional, Type, Union
 from .pdf_processor_port import PdfProcessorPort
 from .file_storage_port import FileStoragePort
 
@@ -34,12 +34,26 @@ class PdfProcessorFactoryPort(ABC):
         pass
     
     @abstractmethod
-    def get_engine_info(self, engine: str) -> Dict[str, Any]:
-        """Get information about a specific engine."""
+    def get_engine_info(self, engine: str) -> Mapping[str, Any]:
+        """
+        Get information about a specific engine.
+        
+        Args:
+            engine: Engine name
+            
+        Returns:
+            Read-only mapping of the engine information (list values are tuples);
+            callers needing a mutable or JSON-serializable copy use dict(...)
+        """
         pass
     
     @abstractmethod
-    def register_engine(self, engine_name: str, engine_info: Dict[str, Any]) -> None:
+    def register_engine(
+        self,
+        engine_name: str,
+        engine_info: Dict[str, Any],
+        loader: Optional[Union[str, Callable[[], Type[PdfProcessorPort]]]] = None
+    ) -> None:
         """Register a new engine with the factory."""
         pass
     
@@ -3,7 +3,7 @@ Port for PDF processing operations.
 This is an interface that defines how the domain can interact with PDF processors.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, List, Optional
 
 from ..domain.entities import Document, Term, TermOccurrence
 
@@ -28,6 +28,45 @@ class PdfProcessorPort(ABC):
         """
         pass
     
+    def extract_all_occurrences(self, document: Document, terms: List[Term]) -> List[TermOccurrence]:
+        """
+        Extract the occurrences of several terms in the document.
+        
+        The default implementation calls extract_text_occurrences once per term.
+        Adapters that can search all terms in a single pass over the pages
+        should override it.
+        
+        Args:
+            document: The PDF document to search in
+            terms: Terms to find
+            
+        Returns:
+            List of term occurrences, grouped by term in the order of terms
+            
+        Raises:
+            DocumentProcessingError: If there's an error processing the document
+        """
+        occurrences = []
+        for term in terms:
+            occurrences.extend(self.extract_text_occurrences(document, term))
+        return occurrences
+    
+    def probe(self, document: Document) -> None:
+        """
+        Check that the document can be opened by this engine.
+        
+        The default implementation searches the document for a placeholder
+        term, which scans every page. Adapters that can open a document
+        without scanning its text should override it.
+        
+        Args:
+            document: The PDF document to check
+            
+        Raises:
+            DocumentProcessingError: If the document cannot be opened
+        """
+        self.extract_text_occurrences(document, Term(text="probe"))
+    
     @abstractmethod
     def obfuscate_occurrences(self, document: Document, occurrences: List[TermOccurrence]) -> bytes:
         """
@@ -45,6 +84,75 @@ class PdfProcessorPort(ABC):
         """
         pass
     
+    def obfuscate_occurrences_to(self, document: Document, occurrences: List[TermOccurrence], dest_path: str) -> None:
+        """
+        Obfuscate the given term occurrences and write the result to a local file.
+        
+        The default implementation writes the bytes returned by
+        obfuscate_occurrences. Adapters that can save the obfuscated document
+        straight to disk, without building it in memory first, should override it.
+        
+        Args:
+            document: The source PDF document
+            occurrences: List of term occurrences to obfuscate
+            dest_path: Local file system path of the obfuscated document
+            
+        Raises:
+            DocumentProcessingError: If there's an error processing the document
+        """
+        content = self.obfuscate_occurrences(document, occurrences)
+        with open(dest_path, "wb") as f:
+            f.write(content)
+    
+    def find_and_obfuscate_to(
+        self,
+        document: Document,
+        terms: List[Term],
+        dest_path: str,
+        select_occurrences: Optional[Callable[[List[TermOccurrence]], List[TermOccurrence]]] = None
+    ) -> List[TermOccurrence]:
+        """
+        Find the terms in the document and write it, obfuscated, to a local file.
+        
+        The default implementation calls extract_all_occurrences then
+        obfuscate_occurrences_to, which may open the document twice. Adapters
+        that can search and redact the same opened document should override it.
+        Nothing is written when there is no occurrence to mask.
+        
+        Args:
+            document: The source PDF document
+            terms: Terms to find
+            dest_path: Local file system path of the obfuscated document
+            select_occurrences: Chooses the found occurrences to mask (default: all)
+            
+        Returns:
+            All found occurrences, grouped by term in the order of terms
+            
+        Raises:
+            DocumentProcessingError: If there's an error processing the document
+        """
+        occurrences = self.extract_all_occurrences(document, terms)
+        occurrences_to_mask = select_occurrences(occurrences) if select_occurrences is not None else occurrences
+        if occurrences_to_mask:
+            self.obfuscate_occurrences_to(document, occurrences_to_mask, dest_path)
+        return occurrences
+    
+    def close(self) -> None:
+        """
+        Release the native resources held by this processor.
+        
+        The default implementation does nothing, for adapters that close every
+        document they open. Adapters keeping documents open between calls
+        should override it. The processor can still be used afterwards.
+        """
+        pass
+    
+    def __enter__(self) -> "PdfProcessorPort":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
     @abstractmethod
     def get_engine_info(self) -> dict:
         """
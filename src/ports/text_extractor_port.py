@@ -27,10 +27,13 @@ class TextExtractorPort(ABC):
         """Get information about this text extractor."""
         pass
     
-    def get_quality_annotation(self) -> Optional[Dict[str, Any]]:
+    def get_quality_annotation(self, document: Optional[Document] = None) -> Optional[Dict[str, Any]]:
         """
         Get quality annotation if available from the extractor.
         
+        Args:
+            document: Document whose annotation is wanted (default: the last extracted one)
+        
         Returns:
             Quality annotation data if available, None otherwise.
             This method has a default implementation that returns None,
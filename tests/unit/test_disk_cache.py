@@ -0,0 +1,54 @@
+import pytest
+from src.adapters.disk_cache import DiskCache
+from src.domain.entities import TextExtractionResult
+
+
+class TestDiskCache:
+    """Unit tests for DiskCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create DiskCache instance in a temporary directory."""
+        return DiskCache(str(tmp_path / "cache"))
+
+    @pytest.fixture
+    def result(self):
+        """Sample extraction result."""
+        return TextExtractionResult(
+            text="first page second page",
+            page_count=2,
+            word_count=4,
+            pages=["first page", "second page"],
+            execution_time=1.5
+        )
+
+    def test_put_and_get(self, cache, result):
+        """Test a stored result is returned for the same key."""
+        key = DiskCache.make_key(b"%PDF-1.4 content", 300)
+        cache.put(key, result)
+
+        cached = cache.get(key)
+
+        assert cached.text == result.text
+        assert cached.pages == result.pages
+        assert cached.page_count == result.page_count
+        assert cached.word_count == result.word_count
+
+    def test_get_missing(self, cache):
+        """Test a missing entry is a miss."""
+        assert cache.get(DiskCache.make_key(b"unknown")) is None
+
+    def test_key_depends_on_settings(self):
+        """Test the key changes with the content and the settings."""
+        key = DiskCache.make_key(b"content", 300, True)
+
+        assert key == DiskCache.make_key(b"content", 300, True)
+        assert key != DiskCache.make_key(b"content", 400, True)
+        assert key != DiskCache.make_key(b"other", 300, True)
+
+    def test_corrupted_entry_is_a_miss(self, cache, tmp_path):
+        """Test an unreadable entry is treated as a miss."""
+        key = DiskCache.make_key(b"content")
+        (tmp_path / "cache" / f"{key}.json").write_text("{not json")
+
+        assert cache.get(key) is None
@@ -90,6 +90,19 @@ class TestLocalStorageAdapter:
         """Test file_exists returns False for directory."""
         assert adapter.file_exists(temp_dir) is False
     
+    def test_get_file_signature_changes_on_write(self, adapter, temp_file):
+        """Test file signature reflects content changes."""
+        signature = adapter.get_file_signature(temp_file)
+        assert signature is not None
+        
+        adapter.write_file(temp_file, b"new and longer content")
+        
+        assert adapter.get_file_signature(temp_file) != signature
+    
+    def test_get_file_signature_not_exists(self, adapter):
+        """Test file signature is None for non-existing file."""
+        assert adapter.get_file_signature("non_existing_file.txt") is None
+    
     def test_read_file_success(self, adapter, temp_file):
         """Test successful file reading."""
         content = adapter.read_file(temp_file)
@@ -97,6 +110,27 @@ class TestLocalStorageAdapter:
         assert isinstance(content, bytes)
         assert content == b"test content"
     
+    def test_open_file(self, adapter, temp_file):
+        """Test opening a file for streamed reading."""
+        with adapter.open_file(temp_file) as stream:
+            assert stream.read() == b"test content"
+    
+    def test_open_file_not_exists(self, adapter):
+        """Test opening non-existing file raises error."""
+        with pytest.raises(FileStorageError):
+            adapter.open_file("non_existing_file.txt")
+    
+    def test_read_file_range(self, adapter, temp_file):
+        """Test reading part of a file from the start or the end."""
+        assert adapter.read_file_range(temp_file, 0, 4) == b"test"
+        assert adapter.read_file_range(temp_file, -7, 1024) == b"content"
+        assert adapter.read_file_range(temp_file, -1024, 4) == b"test"
+    
+    def test_read_file_range_not_exists(self, adapter):
+        """Test reading part of a non-existing file raises error."""
+        with pytest.raises(FileStorageError):
+            adapter.read_file_range("non_existing_file.txt", 0, 10)
+    
     def test_read_file_not_exists(self, adapter):
         """Test reading non-existing file raises error."""
         non_existing = "non_existing_file.txt"
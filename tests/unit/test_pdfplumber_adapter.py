@@ -163,6 +163,41 @@ class TestPdfPlumberAdapter:
         # Should find "test" even when searching for "TEST"
         assert len(occurrences) > 0
     
+    def test_extract_all_occurrences(self, adapter, sample_pdf, sample_terms):
+        """Test a single-pass multi-term search matches per-term searches."""
+        document = Document(path=sample_pdf)
+        
+        occurrences = adapter.extract_all_occurrences(document, sample_terms)
+        
+        expected = []
+        for term in sample_terms:
+            expected.extend(adapter.extract_text_occurrences(document, term))
+        assert occurrences == expected
+    
+    def test_extract_reuses_words_of_unchanged_document(self, adapter, sample_pdf):
+        """Test searching an unchanged document again does not re-extract its words."""
+        document = Document(path=sample_pdf)
+        first = adapter.extract_text_occurrences(document, Term(text="test"))
+        
+        with patch("src.adapters.pdfplumber_adapter.pdfplumber.open") as mock_open:
+            second = adapter.extract_text_occurrences(document, Term(text="test"))
+        
+        mock_open.assert_not_called()
+        assert second == first
+    
+    def test_supplied_content_colliding_key_not_reused(self, adapter, sample_pdf):
+        """Test words cached for other content under the same key are not returned."""
+        with open(sample_pdf, "rb") as f:
+            content = f.read()
+        document = Document(path=sample_pdf, data=content)
+        cache_key = adapter._get_cache_key(document)
+        adapter._words_cache[cache_key] = (b"other content", [([], ["test"])])
+        
+        occurrences = adapter.extract_text_occurrences(document, Term(text="test"))
+        
+        assert adapter._words_cache[cache_key][0] == content
+        assert all(occurrence.position.x1 > occurrence.position.x0 for occurrence in occurrences)
+    
     def test_obfuscate_occurrences(self, adapter, sample_pdf, temp_output_path):
         """Test obfuscation functionality."""
         document = Document(path=sample_pdf)
@@ -4,6 +4,7 @@ import os
 from src.adapters.pymupdf_adapter import PyMuPdfAdapter
 from src.adapters.local_storage_adapter import LocalStorageAdapter
 from src.domain.entities import Document, Term
+from src.domain.exceptions import DocumentProcessingError
 
 
 class TestPyMuPdfAdapter:
@@ -26,6 +27,17 @@ class TestPyMuPdfAdapter:
         assert all(occ.term.text == "test" for occ in occurrences)
         assert all(occ.page_number == 1 for occ in occurrences)
     
+    def test_extract_all_occurrences(self, adapter, sample_pdf, sample_terms):
+        """Test a single-pass multi-term search matches per-term searches."""
+        document = Document(path=sample_pdf)
+        
+        occurrences = adapter.extract_all_occurrences(document, sample_terms)
+        
+        expected = []
+        for term in sample_terms:
+            expected.extend(adapter.extract_text_occurrences(document, term))
+        assert occurrences == expected
+    
     def test_obfuscate_occurrences(self, adapter, sample_pdf, temp_output_path):
         """Test obfuscation."""
         document = Document(path=sample_pdf)
@@ -45,6 +57,59 @@ class TestPyMuPdfAdapter:
         assert os.path.exists(temp_output_path)
         assert os.path.getsize(temp_output_path) > 0
     
+    def test_obfuscate_occurrences_removes_text(self, adapter, sample_pdf):
+        """Test that obfuscated terms are no longer extractable."""
+        import fitz
+        
+        document = Document(path=sample_pdf)
+        term = Term(text="test")
+        
+        occurrences = adapter.extract_text_occurrences(document, term)
+        obfuscated_content = adapter.obfuscate_occurrences(document, occurrences)
+        
+        with fitz.open(stream=obfuscated_content, filetype="pdf") as pdf_doc:
+            text = "".join(page.get_text() for page in pdf_doc).lower()
+        
+        assert "test" not in text
+        assert "sample" in text
+    
+    def test_obfuscate_occurrences_to(self, adapter, sample_pdf, temp_output_path):
+        """Test saving the obfuscated document straight to disk."""
+        import fitz
+        
+        document = Document(path=sample_pdf)
+        occurrences = adapter.extract_text_occurrences(document, Term(text="test"))
+        
+        adapter.obfuscate_occurrences_to(document, occurrences, temp_output_path)
+        
+        with fitz.open(temp_output_path) as pdf_doc:
+            text = "".join(page.get_text() for page in pdf_doc).lower()
+        
+        assert "test" not in text
+        assert "sample" in text
+    
+    def test_find_and_obfuscate_to(self, adapter, sample_pdf, sample_terms, temp_output_path):
+        """Test the single-pass search and redaction matches the two-step API."""
+        import fitz
+        
+        document = Document(path=sample_pdf)
+        
+        occurrences = adapter.find_and_obfuscate_to(document, sample_terms, temp_output_path)
+        
+        assert occurrences == adapter.extract_all_occurrences(document, sample_terms)
+        with fitz.open(temp_output_path) as pdf_doc:
+            text = "".join(page.get_text() for page in pdf_doc).lower()
+        assert all(term.text.lower() not in text for term in sample_terms)
+    
+    def test_probe(self, adapter, sample_pdf, tmp_path):
+        """Test probing accepts a valid PDF and rejects a corrupted one."""
+        adapter.probe(Document(path=sample_pdf))
+        
+        corrupted = tmp_path / "corrupted.pdf"
+        corrupted.write_bytes(b"%PDF-1.4 not really a pdf %%EOF")
+        with pytest.raises(DocumentProcessingError):
+            adapter.probe(Document(path=str(corrupted)))
+    
     def test_get_engine_info(self, adapter):
         """Test engine info."""
         info = adapter.get_engine_info()
@@ -26,6 +26,17 @@ class TestPyPdfium2Adapter:
         assert all(occ.term.text == "test" for occ in occurrences)
         assert all(occ.page_number == 1 for occ in occurrences)
     
+    def test_extract_all_occurrences(self, adapter, sample_pdf, sample_terms):
+        """Test a single-pass multi-term search matches per-term searches."""
+        document = Document(path=sample_pdf)
+        
+        occurrences = adapter.extract_all_occurrences(document, sample_terms)
+        
+        expected = []
+        for term in sample_terms:
+            expected.extend(adapter.extract_text_occurrences(document, term))
+        assert occurrences == expected
+    
     def test_obfuscate_occurrences(self, adapter, sample_pdf, temp_output_path):
         """Test obfuscation."""
         document = Document(path=sample_pdf)
@@ -45,11 +56,68 @@ class TestPyPdfium2Adapter:
         assert os.path.exists(temp_output_path)
         assert os.path.getsize(temp_output_path) > 0
     
+    def test_obfuscate_occurrences_vector(self, sample_pdf):
+        """Test obfuscation with vector rectangles instead of rasterization."""
+        import pypdfium2 as pdfium
+        
+        adapter = PyPdfium2Adapter(LocalStorageAdapter(), flatten=False)
+        document = Document(path=sample_pdf)
+        
+        occurrences = adapter.extract_text_occurrences(document, Term(text="test"))
+        assert len(occurrences) > 0
+        
+        obfuscated_content = adapter.obfuscate_occurrences(document, occurrences)
+        
+        pdf = pdfium.PdfDocument(obfuscated_content)
+        page = pdf[0]
+        paths = list(page.get_objects(filter=[pdfium.raw.FPDF_PAGEOBJ_PATH]))
+        assert len(pdf) == 1
+        # All rectangles of the page are batched into a single path object
+        assert len(paths) == 1
+        pdf.close()
+    
+    def test_document_reused_between_calls(self, adapter, sample_pdf):
+        """Test an unchanged document is opened only once."""
+        document = Document(path=sample_pdf)
+        
+        with adapter._use_document(document) as (_, first):
+            pass
+        with adapter._use_document(document) as (_, second):
+            pass
+        
+        assert first is second
+    
+    def test_evicted_document_stays_open_while_in_use(self, adapter, sample_pdf, tmp_path):
+        """Test a document evicted from the cache is only closed by its last user."""
+        with open(sample_pdf, "rb") as f:
+            content = f.read()
+        
+        with adapter._use_document(Document(path=sample_pdf)) as (_, pdf):
+            # Fill the cache with other documents so the one in use is evicted
+            for index in range(adapter._DOCUMENT_CACHE_SIZE):
+                other = tmp_path / f"other_{index}.pdf"
+                other.write_bytes(content)
+                with adapter._use_document(Document(path=str(other))):
+                    pass
+            
+            assert len(pdf) == 1
+    
+    def test_close_releases_cached_documents(self, adapter, sample_pdf):
+        """Test leaving the adapter's context closes its cached documents."""
+        document = Document(path=sample_pdf)
+        
+        with adapter:
+            adapter.extract_text_occurrences(document, Term(text="test"))
+            assert adapter._document_cache
+        
+        assert not adapter._document_cache
+        assert len(adapter.extract_text_occurrences(document, Term(text="test"))) > 0
+    
     def test_get_engine_info(self, adapter):
         """Test engine info."""
         info = adapter.get_engine_info()
         
-        assert info["name"] == "pypdfium2+PIL+ReportLab"
+        assert info["name"] == "pypdfium2+PIL"
         assert "version" in info
         assert "description" in info
         assert "license" in info 
\ No newline at end of file
@@ -16,4 +16,116 @@ class TestS3StorageAdapter:
         """Test credentials validation."""
         # Test partial credentials - this will fail at boto3 level, not our validation
         # We can't test this without making real AWS calls
-        pass 
\ No newline at end of file
+        pass
+    
+    @pytest.fixture
+    def s3_client(self):
+        """Create an S3 client whose responses are stubbed."""
+        import boto3
+        return boto3.client(
+            's3',
+            region_name='us-east-1',
+            aws_access_key_id='testing',
+            aws_secret_access_key='testing'
+        )
+    
+    @staticmethod
+    def _body(content):
+        """Build a GetObject response body."""
+        import io
+        from botocore.response import StreamingBody
+        return StreamingBody(io.BytesIO(content), len(content))
+    
+    def test_injected_client(self, s3_client):
+        """Test an injected client is used as-is."""
+        adapter = S3StorageAdapter("my-bucket", s3_client=s3_client)
+        
+        assert adapter.s3_client is s3_client
+    
+    def test_read_file_small(self, s3_client):
+        """Test a file smaller than one part is read with a single request."""
+        from botocore.stub import Stubber
+        
+        adapter = S3StorageAdapter("my-bucket", s3_client=s3_client)
+        with Stubber(s3_client) as stubber:
+            stubber.add_response(
+                'get_object',
+                {'Body': self._body(b"%PDF-1.4"), 'ContentRange': 'bytes 0-7/8', 'ETag': '"etag"'},
+                {'Bucket': 'my-bucket', 'Key': 'doc.pdf', 'Range': f"bytes=0-{S3StorageAdapter._READ_PART_SIZE - 1}"}
+            )
+            
+            assert adapter.read_file("doc.pdf") == b"%PDF-1.4"
+            stubber.assert_no_pending_responses()
+    
+    def test_read_file_not_found(self, s3_client):
+        """Test reading a missing file raises error."""
+        from botocore.stub import Stubber
+        
+        adapter = S3StorageAdapter("my-bucket", s3_client=s3_client)
+        with Stubber(s3_client) as stubber:
+            stubber.add_client_error('get_object', service_error_code='NoSuchKey', http_status_code=404)
+            
+            with pytest.raises(FileStorageError):
+                adapter.read_file("missing.pdf")
+    
+    def test_read_file_range_tail(self, s3_client):
+        """Test reading the end of a file uses a suffix range."""
+        from botocore.stub import Stubber
+        
+        adapter = S3StorageAdapter("my-bucket", s3_client=s3_client)
+        with Stubber(s3_client) as stubber:
+            stubber.add_response(
+                'get_object',
+                {'Body': self._body(b"%%EOF\n")},
+                {'Bucket': 'my-bucket', 'Key': 'doc.pdf', 'Range': 'bytes=-1024'}
+            )
+            
+            assert adapter.read_file_range("doc.pdf", -1024, 1024) == b"%%EOF\n"
+    
+    def test_delete_files_batches(self, s3_client):
+        """Test bulk deletion sends one request per 1000 keys."""
+        from botocore.stub import Stubber
+        
+        adapter = S3StorageAdapter("my-bucket", s3_client=s3_client)
+        keys = [f"page_{i}.png" for i in range(1500)]
+        with Stubber(s3_client) as stubber:
+            for batch in (keys[:1000], keys[1000:]):
+                stubber.add_response(
+                    'delete_objects',
+                    {},
+                    {'Bucket': 'my-bucket', 'Delete': {'Objects': [{'Key': key} for key in batch], 'Quiet': True}}
+                )
+            
+            adapter.delete_files(keys)
+            stubber.assert_no_pending_responses()
+    
+    def test_delete_files_reports_failures(self, s3_client):
+        """Test keys that could not be deleted raise error."""
+        from botocore.stub import Stubber
+        
+        adapter = S3StorageAdapter("my-bucket", s3_client=s3_client)
+        with Stubber(s3_client) as stubber:
+            stubber.add_response(
+                'delete_objects',
+                {'Errors': [{'Key': 'locked.pdf', 'Code': 'AccessDenied', 'Message': 'Access Denied'}]}
+            )
+            
+            with pytest.raises(FileStorageError) as exc_info:
+                adapter.delete_files(["a.pdf", "locked.pdf"])
+        
+        assert "locked.pdf" in str(exc_info.value)
+    
+    def test_short_read_timeout_only_for_gets(self):
+        """Test only the client sending GETs uses the short read timeout."""
+        adapter = S3StorageAdapter("my-bucket", aws_access_key_id="testing", aws_secret_access_key="testing")
+        
+        assert adapter._get_client.meta.config.read_timeout == S3StorageAdapter._GET_READ_TIMEOUT
+        assert adapter.s3_client.meta.config.read_timeout > S3StorageAdapter._GET_READ_TIMEOUT
+    
+    def test_close_shuts_down_request_threads(self, s3_client):
+        """Test closing the adapter shuts down the threads sending GETs."""
+        adapter = S3StorageAdapter("my-bucket", s3_client=s3_client)
+        adapter.close()
+        
+        with pytest.raises(RuntimeError):
+            adapter._request_executor.submit(print)